@@ -7,7 +7,7 @@ across the DuxOS network with secure sandboxing and automatic payments.
 
 from .api import TaskEngineAPI
 from .execution_sandbox import ExecutionSandbox
-from .models import Task, TaskResult, TaskStatus, TaskType
+from .models import HashInput, Task, TaskResult, TaskStatus, TaskType
 from .result_verifier import ResultVerifier
 from .task_engine import TaskEngine
 from .task_scheduler import TaskScheduler
@@ -22,5 +22,6 @@ __all__ = [
     "TaskResult",
     "TaskStatus",
     "TaskType",
+    "HashInput",
     "TaskEngineAPI",
 ]
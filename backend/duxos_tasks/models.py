@@ -4,12 +4,17 @@ Task Engine Data Models
 Defines the core data structures for task management, execution, and results.
 """
 
+import sys
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+# Slotted dataclasses (no per-instance __dict__) where the interpreter
+# supports them; dataclass(slots=True) was added in Python 3.10
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class TaskStatus(Enum):
     """Task execution status"""
@@ -23,6 +28,13 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
+class HashInput(Enum):
+    """Serialization fed to the result hash"""
+
+    JSON_SORTED = "json_sorted"  # json.dumps(sort_keys=True), the legacy format
+    CBOR_CANONICAL = "cbor_canonical"  # RFC 8949 deterministic CBOR
+
+
 class TaskType(Enum):
     """Types of computational tasks"""
 
@@ -34,7 +46,7 @@ class TaskType(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Task:
     """Represents a computational task to be executed"""
 
@@ -68,6 +80,7 @@ class Task:
     assigned_at: Optional[datetime] = None
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
+    created_at_ns: int = 0  # time.monotonic_ns() at first submit, process-local
 
     # Metadata
     metadata: Dict[str, Any] = field(default_factory=dict)
@@ -149,6 +162,7 @@ class TaskResult:
 
     # Verification
     result_hash: Optional[str] = None
+    hash_input: HashInput = HashInput.JSON_SORTED
     signature: Optional[str] = None
     verified: bool = False
 
@@ -167,13 +181,14 @@ class TaskResult:
             "memory_used_mb": self.memory_used_mb,
             "cpu_usage_percent": self.cpu_usage_percent,
             "result_hash": self.result_hash,
+            "hash_input": self.hash_input.value,
             "signature": self.signature,
             "verified": self.verified,
             "created_at": self.created_at.isoformat(),
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class NodeCapability:
     """Node capability for task execution"""
 
@@ -223,7 +238,7 @@ class NodeCapability:
         return score
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TaskAssignment:
     """Task assignment to a specific node"""
 
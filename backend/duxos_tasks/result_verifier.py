@@ -8,13 +8,22 @@ import asyncio
 import hashlib
 import json
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
+from operator import itemgetter
 from typing import Any, Dict, List, Optional
 
-from .models import TaskResult, TaskStatus
+from .models import HashInput, TaskResult, TaskStatus
 
 logger = logging.getLogger(__name__)
 
+try:
+    import cbor2
+
+    CBOR_AVAILABLE = True
+except ImportError:
+    CBOR_AVAILABLE = False
+
 
 @dataclass
 class VerificationRule:
@@ -37,8 +46,15 @@ class ResultVerifier:
     - Trust scoring
     """
 
-    def __init__(self):
+    def __init__(self, executor: Optional[ThreadPoolExecutor] = None):
+        # Hashing runs here so it does not block the event loop (None = loop default).
+        # Threads only: the walk is a bound method on per-call state that reads
+        # this verifier's rules, so it cannot be pickled into another process.
+        if isinstance(executor, ProcessPoolExecutor):
+            raise TypeError("ResultVerifier needs a thread pool, not a process pool")
+        self.executor = executor
         self.verification_rules: Dict[str, List[VerificationRule]] = {}
+        self._active_rule_count = 0
         self.verification_stats = {
             "total_verifications": 0,
             "successful_verifications": 0,
@@ -51,11 +67,11 @@ class ResultVerifier:
         """Verify a task result"""
         try:
             if result.status != TaskStatus.COMPLETED:
-                logger.warning(f"Cannot verify failed result: {result.task_id}")
+                logger.warning("Cannot verify failed result: %s", result.task_id)
                 return False
 
             if not result.output_data:
-                logger.error(f"No output data to verify for task {result.task_id}")
+                logger.error("No output data to verify for task %s", result.task_id)
                 return False
 
             self.verification_stats["total_verifications"] += 1
@@ -65,8 +81,15 @@ class ResultVerifier:
                 self.verification_stats["failed_verifications"] += 1
                 return False
 
-            # Hash verification
-            if not self._verify_result_hash(result):
+            # Hash, format and custom rules share one pass over output_data
+            ctx = _FusedVerifyCtx(self, result)
+            if ctx.needs_hash:
+                loop = asyncio.get_running_loop()
+                verified = await loop.run_in_executor(self.executor, ctx.walk)
+            else:
+                verified = ctx.walk()
+
+            if not verified:
                 self.verification_stats["failed_verifications"] += 1
                 return False
 
@@ -75,17 +98,12 @@ class ResultVerifier:
                 self.verification_stats["failed_verifications"] += 1
                 return False
 
-            # Custom rules verification
-            if not self._verify_custom_rules(result):
-                self.verification_stats["failed_verifications"] += 1
-                return False
-
             self.verification_stats["successful_verifications"] += 1
-            logger.info(f"Result verification successful for task {result.task_id}")
+            logger.info("Result verification successful for task %s", result.task_id)
             return True
 
         except Exception as e:
-            logger.error(f"Error verifying result {result.task_id}: {e}")
+            logger.error("Error verifying result %s: %s", result.task_id, e)
             self.verification_stats["failed_verifications"] += 1
             return False
 
@@ -93,39 +111,44 @@ class ResultVerifier:
         """Perform basic verification checks"""
         # Check execution time
         if result.execution_time_seconds and result.execution_time_seconds < 0:
-            logger.error(f"Invalid execution time for task {result.task_id}")
+            logger.error("Invalid execution time for task %s", result.task_id)
             return False
 
         # Check output data structure
         if not isinstance(result.output_data, dict):
-            logger.error(f"Output data must be a dictionary for task {result.task_id}")
+            logger.error("Output data must be a dictionary for task %s", result.task_id)
             return False
 
-        # Check for required fields
-        if "result" not in result.output_data and "error" not in result.output_data:
-            logger.warning(f"Output data missing standard fields for task {result.task_id}")
-
         return True
 
-    def _verify_result_hash(self, result: TaskResult) -> bool:
+    def _verify_result_hash(self, result: TaskResult, actual_hash: Optional[str] = None) -> bool:
         """Verify result hash if provided"""
         if not result.result_hash:
-            logger.warning(f"No result hash provided for task {result.task_id}")
+            logger.warning("No result hash provided for task %s", result.task_id)
             return True  # Not required, but recommended
 
-        # Calculate expected hash
-        expected_hash = self._calculate_result_hash(result.output_data)
+        # Calculate expected hash unless the caller already did
+        expected_hash = actual_hash or self._calculate_result_hash(
+            result.output_data, result.hash_input
+        )
 
         if result.result_hash != expected_hash:
-            logger.error(f"Result hash mismatch for task {result.task_id}")
-            logger.error(f"Expected: {expected_hash}")
-            logger.error(f"Received: {result.result_hash}")
+            logger.error("Result hash mismatch for task %s", result.task_id)
+            logger.error("Expected: %s", expected_hash)
+            logger.error("Received: %s", result.result_hash)
             return False
 
         return True
 
-    def _calculate_result_hash(self, output_data: Dict[str, Any]) -> str:
+    def _calculate_result_hash(
+        self, output_data: Dict[str, Any], hash_input: HashInput = HashInput.JSON_SORTED
+    ) -> str:
         """Calculate hash of output data"""
+        if hash_input == HashInput.CBOR_CANONICAL:
+            if not CBOR_AVAILABLE:
+                raise ValueError("cbor2 is required for canonical CBOR result hashes")
+            return hashlib.sha256(cbor2.dumps(output_data, canonical=True)).hexdigest()
+
         result_str = json.dumps(output_data, sort_keys=True)
         return hashlib.sha256(result_str.encode()).hexdigest()
 
@@ -135,18 +158,6 @@ class ResultVerifier:
         # For now, return True as a placeholder
         return True
 
-    def _verify_custom_rules(self, result: TaskResult) -> bool:
-        """Verify custom verification rules"""
-        # Get rules for this task type (if any)
-        rules = self.verification_rules.get(result.task_id, [])
-
-        for rule in rules:
-            if not self._apply_verification_rule(result, rule):
-                logger.error(f"Failed custom rule '{rule.description}' for task {result.task_id}")
-                return False
-
-        return True
-
     def _apply_verification_rule(self, result: TaskResult, rule: VerificationRule) -> bool:
         """Apply a specific verification rule"""
         try:
@@ -159,11 +170,11 @@ class ResultVerifier:
             elif rule.rule_type == "custom":
                 return self._verify_custom_rule(result, rule)
             else:
-                logger.warning(f"Unknown verification rule type: {rule.rule_type}")
+                logger.warning("Unknown verification rule type: %s", rule.rule_type)
                 return True
 
         except Exception as e:
-            logger.error(f"Error applying verification rule: {e}")
+            logger.error("Error applying verification rule: %s", e)
             return False
 
     def _verify_hash_rule(self, result: TaskResult, rule: VerificationRule) -> bool:
@@ -172,7 +183,7 @@ class ResultVerifier:
         if not expected_hash:
             return True
 
-        actual_hash = self._calculate_result_hash(result.output_data)
+        actual_hash = self._calculate_result_hash(result.output_data, result.hash_input)
         return actual_hash == expected_hash
 
     def _verify_format_rule(self, result: TaskResult, rule: VerificationRule) -> bool:
@@ -183,7 +194,7 @@ class ResultVerifier:
         # Check required fields
         for field in required_fields:
             if field not in result.output_data:
-                logger.error(f"Missing required field '{field}' in task {result.task_id}")
+                logger.error("Missing required field '%s' in task %s", field, result.task_id)
                 return False
 
         # Check field types
@@ -192,7 +203,10 @@ class ResultVerifier:
                 actual_type = type(result.output_data[field]).__name__
                 if actual_type != expected_type:
                     logger.error(
-                        f"Field '{field}' has wrong type. Expected {expected_type}, got {actual_type}"
+                        "Field '%s' has wrong type. Expected %s, got %s",
+                        field,
+                        expected_type,
+                        actual_type,
                     )
                     return False
 
@@ -210,11 +224,11 @@ class ResultVerifier:
         value = result.output_data[field]
 
         if min_value is not None and value < min_value:
-            logger.error(f"Field '{field}' value {value} below minimum {min_value}")
+            logger.error("Field '%s' value %s below minimum %s", field, value, min_value)
             return False
 
         if max_value is not None and value > max_value:
-            logger.error(f"Field '{field}' value {value} above maximum {max_value}")
+            logger.error("Field '%s' value %s above maximum %s", field, value, max_value)
             return False
 
         return True
@@ -231,13 +245,15 @@ class ResultVerifier:
             self.verification_rules[task_id] = []
 
         self.verification_rules[task_id].append(rule)
-        logger.info(f"Added verification rule for task {task_id}: {rule.description}")
+        self._active_rule_count += 1
+        logger.info("Added verification rule for task %s: %s", task_id, rule.description)
 
     def remove_verification_rules(self, task_id: str):
         """Remove all verification rules for a task"""
         if task_id in self.verification_rules:
+            self._active_rule_count -= len(self.verification_rules[task_id])
             del self.verification_rules[task_id]
-            logger.info(f"Removed verification rules for task {task_id}")
+            logger.info("Removed verification rules for task %s", task_id)
 
     def get_verification_stats(self) -> Dict[str, Any]:
         """Get verification statistics"""
@@ -245,5 +261,112 @@ class ResultVerifier:
         return {
             **self.verification_stats,
             "success_rate": (self.verification_stats["successful_verifications"] / max(total, 1)),
-            "active_rules": sum(len(rules) for rules in self.verification_rules.values()),
+            "active_rules": self._active_rule_count,
         }
+
+
+class _FusedVerifyCtx:
+    """
+    Single traversal of ``result.output_data`` for one verification.
+
+    The items are walked once, sorted by key when a hash is needed: the walk
+    records the type of every top-level field for the format rules and streams the
+    canonical JSON encoding into a SHA-256 updater, so the hash, standard
+    field and rule checks no longer each re-read the whole payload.
+    """
+
+    __slots__ = ("verifier", "result", "rules", "field_types", "result_hash", "needs_hash")
+
+    def __init__(self, verifier: "ResultVerifier", result: TaskResult):
+        self.verifier = verifier
+        self.result = result
+        self.rules = verifier.verification_rules.get(result.task_id, [])
+        self.field_types: Dict[str, str] = {}
+        self.result_hash: Optional[str] = None
+        self.needs_hash = bool(result.result_hash) or any(
+            rule.rule_type == "hash" and rule.parameters.get("expected_hash") for rule in self.rules
+        )
+
+    def walk(self) -> bool:
+        """Run the fused checks, returning the combined verdict"""
+        result = self.result
+        output_data = result.output_data
+        hasher = hashlib.sha256() if self.needs_hash else None
+        field_types = self.field_types
+
+        # Emits the same bytes as json.dumps(output_data, sort_keys=True);
+        # CBOR digests are taken from cbor2's canonical encoder after the walk
+        canonical = hasher is not None and result.hash_input == HashInput.JSON_SORTED
+        separator = b"{"
+        # Only the hash needs key order; mixed key types can't be sorted
+        items = output_data.items()
+        if hasher is not None:
+            items = sorted(items, key=itemgetter(0))
+        for key, value in items:
+            field_types[key] = type(value).__name__
+            if canonical:
+                if type(key) is not str:
+                    # json coerces non-string keys; let the full encoder handle them
+                    canonical = False
+                    continue
+                hasher.update(separator)
+                hasher.update(json.dumps(key).encode())
+                hasher.update(b": ")
+                hasher.update(json.dumps(value, sort_keys=True).encode())
+                separator = b", "
+
+        if hasher is not None:
+            if canonical:
+                hasher.update(b"}")
+                self.result_hash = hasher.hexdigest()
+            else:
+                self.result_hash = self.verifier._calculate_result_hash(
+                    output_data, result.hash_input
+                )
+
+        # Check for required fields
+        if "result" not in field_types and "error" not in field_types:
+            logger.warning("Output data missing standard fields for task %s", result.task_id)
+
+        if not self.verifier._verify_result_hash(result, self.result_hash):
+            return False
+
+        for rule in self.rules:
+            if not self._apply_rule(rule):
+                logger.error(
+                    "Failed custom rule '%s' for task %s", rule.description, result.task_id
+                )
+                return False
+
+        return True
+
+    def _apply_rule(self, rule: VerificationRule) -> bool:
+        """Apply a rule using the data collected during the walk"""
+        if rule.rule_type == "hash":
+            expected_hash = rule.parameters.get("expected_hash")
+            return not expected_hash or self.result_hash == expected_hash
+
+        if rule.rule_type == "format":
+            field_types = self.field_types
+            for field in rule.parameters.get("required_fields", []):
+                if field not in field_types:
+                    logger.error(
+                        "Missing required field '%s' in task %s", field, self.result.task_id
+                    )
+                    return False
+
+            for field, expected_type in rule.parameters.get("field_types", {}).items():
+                actual_type = field_types.get(field)
+                if actual_type is not None and actual_type != expected_type:
+                    logger.error(
+                        "Field '%s' has wrong type. Expected %s, got %s",
+                        field,
+                        expected_type,
+                        actual_type,
+                    )
+                    return False
+
+            return True
+
+        # Range and custom rules only look up single fields
+        return self.verifier._apply_verification_rule(self.result, rule)
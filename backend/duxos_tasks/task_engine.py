@@ -19,6 +19,7 @@ from dataclasses import dataclass, asdict
 import subprocess
 import tempfile
 import shutil
+import time
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -69,7 +70,7 @@ class Task:
         if self.created_at is None:
             self.created_at = datetime.utcnow()
         if self.updated_at is None:
-            self.updated_at = datetime.utcnow()
+            self.updated_at = self.created_at
 
 
 @dataclass
@@ -153,7 +154,7 @@ class TaskEngine:
                 logger.info("Task database initialized successfully")
                 
         except Exception as e:
-            logger.error(f"Failed to initialize task database: {e}")
+            logger.error("Failed to initialize task database: %s", e)
             raise
     
     def _init_docker(self):
@@ -162,7 +163,7 @@ class TaskEngine:
             self.docker_client = docker.from_env()
             logger.info("Docker client initialized successfully")
         except Exception as e:
-            logger.warning(f"Failed to initialize Docker client: {e}")
+            logger.warning("Failed to initialize Docker client: %s", e)
             self.docker_client = None
     
     def submit_task(
@@ -215,11 +216,11 @@ class TaskEngine:
                 ))
                 conn.commit()
             
-            logger.info(f"Submitted task {task_id} with reward {reward} {currency}")
+            logger.info("Submitted task %s with reward %s %s", task_id, reward, currency)
             return task
 
         except Exception as e:
-            logger.error(f"Failed to submit task: {e}")
+            logger.error("Failed to submit task: %s", e)
             raise
 
     def get_available_tasks(self, node_capabilities: List[str]) -> List[Task]:
@@ -275,7 +276,7 @@ class TaskEngine:
                 return available_tasks
                 
         except Exception as e:
-            logger.error(f"Failed to get available tasks: {e}")
+            logger.error("Failed to get available tasks: %s", e)
             return []
     
     def assign_task(self, task_id: str, node_id: str) -> bool:
@@ -296,19 +297,20 @@ class TaskEngine:
                 
                 if cursor.rowcount > 0:
                     conn.commit()
-                    logger.info(f"Assigned task {task_id} to node {node_id}")
+                    logger.info("Assigned task %s to node %s", task_id, node_id)
                     return True
                 else:
-                    logger.warning(f"Failed to assign task {task_id} - not available")
+                    logger.warning("Failed to assign task %s - not available", task_id)
                     return False
 
         except Exception as e:
-            logger.error(f"Failed to assign task {task_id}: {e}")
+            logger.error("Failed to assign task %s: %s", task_id, e)
             return False
 
     def start_task(self, task_id: str, node_id: str) -> bool:
         """Start execution of a task"""
         try:
+            now = datetime.utcnow().isoformat()
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
@@ -317,31 +319,32 @@ class TaskEngine:
                     WHERE task_id = ? AND assigned_node_id = ?
                 """, (
                     TaskStatus.RUNNING.value,
-                    datetime.utcnow().isoformat(),
-                    datetime.utcnow().isoformat(),
+                    now,
+                    now,
                     task_id,
                     node_id
                 ))
                 
                 if cursor.rowcount > 0:
                     conn.commit()
-                    logger.info(f"Started task {task_id} on node {node_id}")
+                    logger.info("Started task %s on node %s", task_id, node_id)
                     return True
                 else:
-                    logger.warning(f"Failed to start task {task_id} - not assigned to node {node_id}")
+                    logger.warning("Failed to start task %s - not assigned to node %s", task_id, node_id)
                     return False
-                    
-            except Exception as e:
-            logger.error(f"Failed to start task {task_id}: {e}")
+
+        except Exception as e:
+            logger.error("Failed to start task %s: %s", task_id, e)
             return False
     
     def complete_task(self, task_id: str, node_id: str, result: Dict[str, Any], execution_time: float) -> bool:
         """Complete a task with results"""
         try:
+            now = datetime.utcnow().isoformat()
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
 
-            # Update task status
+                # Update task status
                 cursor.execute("""
                     UPDATE tasks 
                     SET status = ?, result = ?, completed_at = ?, updated_at = ?
@@ -349,8 +352,8 @@ class TaskEngine:
                 """, (
                     TaskStatus.COMPLETED.value,
                     json.dumps(result),
-                    datetime.utcnow().isoformat(),
-                    datetime.utcnow().isoformat(),
+                    now,
+                    now,
                     task_id,
                     node_id
                 ))
@@ -370,23 +373,24 @@ class TaskEngine:
                         json.dumps(result),
                         execution_time,
                         "pending",
-                        datetime.utcnow().isoformat()
+                        now
                     ))
                     
                     conn.commit()
-                    logger.info(f"Completed task {task_id} on node {node_id}")
+                    logger.info("Completed task %s on node %s", task_id, node_id)
                     return True
                 else:
-                    logger.warning(f"Failed to complete task {task_id} - not assigned to node {node_id}")
+                    logger.warning("Failed to complete task %s - not assigned to node %s", task_id, node_id)
                     return False
 
         except Exception as e:
-            logger.error(f"Failed to complete task {task_id}: {e}")
+            logger.error("Failed to complete task %s: %s", task_id, e)
             return False
     
     def fail_task(self, task_id: str, node_id: str, error_message: str) -> bool:
         """Mark a task as failed"""
         try:
+            now = datetime.utcnow().isoformat()
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
@@ -396,22 +400,22 @@ class TaskEngine:
                 """, (
                     TaskStatus.FAILED.value,
                     error_message,
-                    datetime.utcnow().isoformat(),
-                    datetime.utcnow().isoformat(),
+                    now,
+                    now,
                     task_id,
                     node_id
                 ))
                 
                 if cursor.rowcount > 0:
                     conn.commit()
-                    logger.info(f"Failed task {task_id} on node {node_id}: {error_message}")
+                    logger.info("Failed task %s on node %s: %s", task_id, node_id, error_message)
                     return True
                 else:
-                    logger.warning(f"Failed to mark task {task_id} as failed - not assigned to node {node_id}")
+                    logger.warning("Failed to mark task %s as failed - not assigned to node %s", task_id, node_id)
                     return False
 
         except Exception as e:
-            logger.error(f"Failed to mark task {task_id} as failed: {e}")
+            logger.error("Failed to mark task %s as failed: %s", task_id, e)
             return False
     
     def execute_task_in_sandbox(self, task: Task) -> Tuple[bool, Dict[str, Any], float]:
@@ -421,7 +425,7 @@ class TaskEngine:
             return False, {"error": "Docker not available"}, 0.0
         
         try:
-            start_time = datetime.utcnow()
+            start_time = time.monotonic()
             
             # Create temporary directory for task files
             with tempfile.TemporaryDirectory() as temp_dir:
@@ -451,17 +455,17 @@ class TaskEngine:
                     if result['StatusCode'] == 0:
                         # Task completed successfully
                         logs = container.logs().decode('utf-8')
-                        execution_time = (datetime.utcnow() - start_time).total_seconds()
+                        execution_time = time.monotonic() - start_time
                         
                         return True, {
                             "success": True,
                             "output": logs,
                             "execution_time": execution_time
                         }, execution_time
-            else:
+                    else:
                         # Task failed
                         logs = container.logs().decode('utf-8')
-                        execution_time = (datetime.utcnow() - start_time).total_seconds()
+                        execution_time = time.monotonic() - start_time
                         
                         return False, {
                             "success": False,
@@ -472,7 +476,7 @@ class TaskEngine:
                 except Exception as e:
                     # Task timed out or failed
                     container.kill()
-                    execution_time = (datetime.utcnow() - start_time).total_seconds()
+                    execution_time = time.monotonic() - start_time
                     
                     return False, {
                         "success": False,
@@ -481,7 +485,7 @@ class TaskEngine:
                     }, execution_time
 
         except Exception as e:
-            logger.error(f"Failed to execute task in sandbox: {e}")
+            logger.error("Failed to execute task in sandbox: %s", e)
             return False, {"error": str(e)}, 0.0
     
     def get_task(self, task_id: str) -> Optional[Task]:
@@ -521,7 +525,7 @@ class TaskEngine:
                 )
 
         except Exception as e:
-            logger.error(f"Failed to get task {task_id}: {e}")
+            logger.error("Failed to get task %s: %s", task_id, e)
             return None
     
     def get_task_statistics(self) -> Dict[str, Any]:
@@ -559,7 +563,7 @@ class TaskEngine:
                 }
 
         except Exception as e:
-            logger.error(f"Failed to get task statistics: {e}")
+            logger.error("Failed to get task statistics: %s", e)
             return {}
 
 
@@ -7,18 +7,41 @@ load balancing, and reputation scoring.
 
 import asyncio
 import heapq
+import itertools
 import logging
-import random
+import time
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
-from .models import NodeCapability, Task, TaskAssignment, TaskStatus
+import numpy as np
+
+from .models import DATACLASS_SLOTS, NodeCapability, Task, TaskAssignment, TaskStatus
 
 logger = logging.getLogger(__name__)
 
+# Cancelled entries stay in the heap until popped; rebuild it once they
+# make up this fraction of a queue of at least _MIN_COMPACT_SIZE entries
+_CANCELLED_COMPACT_FRACTION = 0.25
+_MIN_COMPACT_SIZE = 100
+
+# Heap keys pack the priority band above the 64-bit monotonic submit time,
+# so entries order by priority and then FIFO with a single int comparison
+_PRIORITY_SHIFT = 64
+
+# Submitters blocked on a full queue resume once it drains below this
+# fraction of max_queue_size
+_QUEUE_RESUME_FRACTION = 0.8
+
+# Candidates ranked up front per task; doubled each time all are rejected
+_INITIAL_CANDIDATES = 4
+
+# Candidate ranking record, compared field by field like a (-score, index) tuple
+_RANK_KEY = np.dtype([("neg_score", np.float64), ("index", np.intp)])
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class SchedulingMetrics:
     """Metrics for scheduling decisions"""
 
@@ -29,6 +52,111 @@ class SchedulingMetrics:
     load_distribution: Dict[str, int] = field(default_factory=dict)
 
 
+# Stand-in nodes used when no registry client is configured
+_MOCK_NODES = (
+    NodeCapability(
+        node_id="node_001",
+        cpu_cores=4,
+        memory_mb=8192,
+        storage_gb=100,
+        supported_services=["image_upscaler_v1", "text_processor"],
+        reputation_score=85.0,
+        success_rate=0.95,
+    ),
+    NodeCapability(
+        node_id="node_002",
+        cpu_cores=8,
+        memory_mb=16384,
+        storage_gb=200,
+        gpu_enabled=True,
+        supported_services=["machine_learning", "data_analysis"],
+        reputation_score=92.0,
+        success_rate=0.98,
+    ),
+    NodeCapability(
+        node_id="node_003",
+        cpu_cores=2,
+        memory_mb=4096,
+        storage_gb=50,
+        supported_services=["api_call", "batch_processing"],
+        reputation_score=75.0,
+        success_rate=0.88,
+    ),
+)
+
+
+def _entry_priority(entry: Tuple[int, int, Task]) -> int:
+    """Priority band packed into a heap entry's key"""
+    return 5 - (entry[0] >> _PRIORITY_SHIFT)
+
+
+class _NodeTable:
+    """
+    Struct-of-arrays view of the nodes available for one scheduling pass.
+
+    Each node attribute used for filtering and scoring is held in a
+    contiguous array indexed by node position, so a task is scored against
+    every node with a handful of vectorized operations.
+    """
+
+    def __init__(
+        self,
+        nodes: List[NodeCapability],
+        node_load: Dict[str, int],
+        reputation_weight: float,
+        success_weight: float,
+        load_penalty: float,
+        affinity_bonus: float,
+    ):
+        count = len(nodes)
+        self.load_weight = -load_penalty
+        self.affinity_bonus = affinity_bonus
+        self.nodes = nodes
+        self.cpu_cores = np.fromiter((n.cpu_cores for n in nodes), dtype=np.int64, count=count)
+        self.memory_mb = np.fromiter((n.memory_mb for n in nodes), dtype=np.int64, count=count)
+
+        # Score terms that do not depend on the task, summed once per pass
+        reputation = np.fromiter(
+            (n.reputation_score or 0.0 for n in nodes), dtype=np.float64, count=count
+        )
+        success_rate = np.fromiter(
+            (n.success_rate or 0.0 for n in nodes), dtype=np.float64, count=count
+        )
+        avg_execution_time = np.fromiter(
+            (n.avg_execution_time or 0.0 for n in nodes), dtype=np.float64, count=count
+        )
+        self.base_score = np.fromiter((n.get_score() for n in nodes), dtype=np.float64, count=count)
+        self.base_score += reputation * reputation_weight
+        self.base_score += success_rate * success_weight
+        self.base_score += np.where(
+            avg_execution_time != 0, np.maximum(0, 100 - avg_execution_time), 0
+        )
+
+        self.load = np.fromiter(
+            (node_load.get(n.node_id, 0) for n in nodes),
+            dtype=np.int64,
+            count=count,
+        )
+
+        # Reused by every task scored in this pass
+        self.scores = np.empty(count, dtype=np.float64)
+
+        # One boolean node mask per service, built in a single pass so a
+        # task's service check is a dict lookup and an AND
+        self._no_nodes = np.zeros(count, dtype=np.bool_)
+        self.service_masks: Dict[str, np.ndarray] = {}
+        for index, node in enumerate(nodes):
+            for service_name in node.supported_services:
+                mask = self.service_masks.get(service_name)
+                if mask is None:
+                    mask = self.service_masks[service_name] = np.zeros(count, dtype=np.bool_)
+                mask[index] = True
+
+    def supports(self, service_name: str) -> np.ndarray:
+        """Boolean mask of nodes that list the service"""
+        return self.service_masks.get(service_name, self._no_nodes)
+
+
 class TaskScheduler:
     """
     Intelligent task scheduler that assigns tasks to optimal nodes.
@@ -45,21 +173,26 @@ class TaskScheduler:
         self.registry_client = registry_client
         self.max_retries = max_retries
 
-        # Task queues by priority (stored as tuples for heapq)
-        self.priority_queues: Dict[int, List[Tuple[int, float, Task]]] = {
-            1: [],  # Low priority
-            2: [],
-            3: [],
-            4: [],
-            5: [],  # High priority
-        }
+        # Single task queue of (key, seq, task) entries, where key packs
+        # (5 - priority, created_at_ns); the sequence number breaks ties so
+        # heapq never has to compare Task objects
+        self._heap: List[Tuple[int, int, Task]] = []
+        self._seq = itertools.count()
+        self._queued: Set[str] = set()
+        self._cancelled: Set[str] = set()
+
+        # Backpressure: submit_task waits and submit_task_nowait refuses while
+        # max_queue_size tasks are queued; created lazily inside the event loop
+        self.max_queue_size = 10_000
+        self._queue_drained: Optional[asyncio.Event] = None
 
         # Node assignments tracking
-        self.node_assignments: Dict[str, List[TaskAssignment]] = {}
+        self.node_assignments: Dict[str, Set[str]] = defaultdict(set)
         self.task_assignments: Dict[str, TaskAssignment] = {}
+        self._node_load: Dict[str, int] = defaultdict(int)
 
-        # Scheduling metrics
-        self.metrics = SchedulingMetrics()
+        # Scheduling metrics; the load distribution is the live per-node counter
+        self.metrics = SchedulingMetrics(load_distribution=self._node_load)
 
         # Configuration
         self.enable_load_balancing = True
@@ -67,25 +200,84 @@ class TaskScheduler:
         self.max_tasks_per_node = 10
         self.assignment_timeout = 300  # seconds
 
+        # Registry nodes are reused for this long before a background refresh
+        self.node_cache_ttl = 2.0  # seconds
+        self._nodes_cache: List[NodeCapability] = []
+        self._nodes_cache_expiry = 0.0
+        self._nodes_refresh: Optional[asyncio.Task] = None
+
+        # Node score weights, bound into the node table once per pass
+        self.reputation_weight = 0.5
+        self.success_weight = 50.0
+        self.load_penalty = 10.0
+        self.affinity_bonus = 100.0
+
         logger.info("Task Scheduler initialized")
 
     async def submit_task(self, task: Task) -> bool:
-        """Submit a task for scheduling"""
+        """Submit a task for scheduling, waiting while the queue is full"""
+        while self._queue_full():
+            if self._queue_drained is None:
+                self._queue_drained = asyncio.Event()
+            self._queue_drained.clear()
+            await self._queue_drained.wait()
+        return self.submit_task_nowait(task)
+
+    def submit_task_nowait(self, task: Task) -> bool:
+        """Submit a task for scheduling without going through the event loop"""
         try:
-            # Add task to appropriate priority queue
-            priority = min(max(task.priority, 1), 5)
-            heapq.heappush(
-                self.priority_queues[priority], (-priority, task.created_at.timestamp(), task)
-            )
+            if self._queue_full():
+                logger.warning(f"Task queue full, rejecting task {task.task_id}")
+                return False
+
+            # A resubmitted task must not inherit its old tombstone
+            if task.task_id in self._cancelled:
+                self._compact_queue()
+
+            # Add task to the priority queue
+            entry = self._queue_entry(task)
+            heapq.heappush(self._heap, entry)
+            self._queued.add(task.task_id)
 
             self.metrics.total_tasks += 1
-            logger.info(f"Task {task.task_id} submitted with priority {priority}")
+            logger.info(f"Task {task.task_id} submitted with priority {_entry_priority(entry)}")
             return True
 
         except Exception as e:
             logger.error(f"Failed to submit task {task.task_id}: {e}")
             return False
 
+    def submit_many(self, tasks: Iterable[Task]) -> int:
+        """
+        Submit a batch of tasks, heapifying once; returns the number queued.
+
+        Tasks beyond the free queue capacity are not consumed from the iterable.
+        """
+        room = max(self.max_queue_size - len(self._queued), 0)
+        entries = [self._queue_entry(task) for task in itertools.islice(tasks, room)]
+        if not entries:
+            return 0
+
+        task_ids = {entry[-1].task_id for entry in entries}
+        if not self._cancelled.isdisjoint(task_ids):
+            self._compact_queue()
+
+        self._heap.extend(entries)
+        heapq.heapify(self._heap)
+        self._queued.update(task_ids)
+
+        self.metrics.total_tasks += len(entries)
+        logger.info(f"Submitted {len(entries)} tasks")
+        return len(entries)
+
+    def _queue_entry(self, task: Task) -> Tuple[int, int, Task]:
+        """Build the heap entry for a task"""
+        priority = min(max(task.priority, 1), 5)
+        if not task.created_at_ns:
+            task.created_at_ns = time.monotonic_ns()
+        key = (5 - priority) << _PRIORITY_SHIFT | task.created_at_ns
+        return (key, next(self._seq), task)
+
     async def schedule_tasks(self) -> List[TaskAssignment]:
         """Schedule pending tasks to available nodes"""
         assignments = []
@@ -96,36 +288,45 @@ class TaskScheduler:
             if not available_nodes:
                 logger.warning("No available nodes for task scheduling")
                 return assignments
+            node_table = _NodeTable(
+                available_nodes,
+                self._node_load,
+                reputation_weight=(
+                    self.reputation_weight if self.enable_reputation_weighting else 0.0
+                ),
+                success_weight=self.success_weight,
+                load_penalty=self.load_penalty,
+                affinity_bonus=self.affinity_bonus,
+            )
 
             # Process tasks by priority (highest first)
-            for priority in range(5, 0, -1):
-                while self.priority_queues[priority]:
-                    # Get next task
-                    _, _, task = heapq.heappop(self.priority_queues[priority])
-
-                    # Try to assign task
-                    assignment = await self._assign_task_to_node(task, available_nodes)
-                    if assignment:
-                        assignments.append(assignment)
-                        self.metrics.assigned_tasks += 1
+            while self._heap:
+                # Get next task
+                entry = heapq.heappop(self._heap)
+                task = entry[-1]
+                if task.task_id in self._cancelled:
+                    self._cancelled.discard(task.task_id)
+                    continue
+                self._queued.discard(task.task_id)
+
+                # Try to assign task
+                assignment = self._assign_task_to_node(task, node_table)
+                if assignment:
+                    assignments.append(assignment)
+                    self.metrics.assigned_tasks += 1
+                else:
+                    # Re-queue task if assignment failed
+                    retry_count = task.metadata.get("retry_count", 0)
+                    if retry_count < self.max_retries:
+                        task.metadata["retry_count"] = retry_count + 1
+                        heapq.heappush(self._heap, entry)
+                        self._queued.add(task.task_id)
+                        logger.warning(f"Re-queuing task {task.task_id} for retry")
                     else:
-                        # Re-queue task if assignment failed
-                        retry_count = task.metadata.get("retry_count", 0)
-                        if retry_count < self.max_retries:
-                            task.metadata["retry_count"] = retry_count + 1
-                            heapq.heappush(
-                                self.priority_queues[priority],
-                                (-priority, task.created_at.timestamp(), task),
-                            )
-                            logger.warning(f"Re-queuing task {task.task_id} for retry")
-                        else:
-                            self.metrics.failed_assignments += 1
-                            logger.error(
-                                f"Task {task.task_id} failed after {self.max_retries} retries"
-                            )
-
-            # Update metrics
-            self._update_metrics()
+                        self.metrics.failed_assignments += 1
+                        logger.error(f"Task {task.task_id} failed after {self.max_retries} retries")
+
+            self._release_submitters()
 
         except Exception as e:
             logger.error(f"Error in task scheduling: {e}")
@@ -133,76 +334,100 @@ class TaskScheduler:
         return assignments
 
     async def _get_available_nodes(self) -> List[NodeCapability]:
-        """Get available nodes from registry"""
-        try:
-            if not self.registry_client:
-                # Return mock nodes for testing
+        """Get available nodes from registry, serving a cached list while it is fresh"""
+        if not self.registry_client:
+            # Return mock nodes for testing
+            return self._get_mock_nodes()
+
+        if not self._nodes_cache:
+            # Nothing cached yet, the first pass has to wait for the registry
+            try:
+                return await self._refresh_nodes()
+            except Exception as e:
+                logger.error(f"Error getting available nodes: {e}")
                 return self._get_mock_nodes()
 
-            # Query registry for healthy nodes
-            nodes = await self.registry_client.get_healthy_nodes()
-
-            # Convert to NodeCapability objects
-            capabilities = []
-            for node in nodes:
-                capability = NodeCapability(
-                    node_id=node.get("node_id"),
-                    cpu_cores=node.get("cpu_cores", 1),
-                    memory_mb=node.get("memory_mb", 512),
-                    storage_gb=node.get("storage_gb", 10),
-                    gpu_enabled=node.get("gpu_enabled", False),
-                    supported_services=node.get("capabilities", []),
-                    reputation_score=node.get("reputation", 50.0),
-                    success_rate=node.get("success_rate", 0.8),
-                )
-                capabilities.append(capability)
-
-            return capabilities
+        # Serve the cached nodes; refresh them in the background once stale
+        if time.monotonic() >= self._nodes_cache_expiry and (
+            self._nodes_refresh is None or self._nodes_refresh.done()
+        ):
+            self._nodes_refresh = asyncio.create_task(self._refresh_nodes_in_background())
+        return self._nodes_cache
+
+    async def _refresh_nodes(self) -> List[NodeCapability]:
+        """Query the registry for healthy nodes and cache them"""
+        nodes = await self.registry_client.get_healthy_nodes()
+
+        # Convert to NodeCapability objects
+        capabilities = []
+        for node in nodes:
+            capability = NodeCapability(
+                node_id=node.get("node_id"),
+                cpu_cores=node.get("cpu_cores", 1),
+                memory_mb=node.get("memory_mb", 512),
+                storage_gb=node.get("storage_gb", 10),
+                gpu_enabled=node.get("gpu_enabled", False),
+                supported_services=node.get("capabilities", []),
+                reputation_score=node.get("reputation", 50.0),
+                success_rate=node.get("success_rate", 0.8),
+            )
+            capabilities.append(capability)
+
+        self._nodes_cache = capabilities
+        self._nodes_cache_expiry = time.monotonic() + self.node_cache_ttl
+        return capabilities
 
+    async def _refresh_nodes_in_background(self):
+        """Refresh the node cache, keeping the stale list if the registry fails"""
+        try:
+            await self._refresh_nodes()
         except Exception as e:
-            logger.error(f"Error getting available nodes: {e}")
-            return self._get_mock_nodes()
+            logger.error(f"Error refreshing available nodes: {e}")
 
-    async def _assign_task_to_node(
-        self, task: Task, available_nodes: List[NodeCapability]
-    ) -> Optional[TaskAssignment]:
+    def _assign_task_to_node(self, task: Task, node_table: _NodeTable) -> Optional[TaskAssignment]:
         """Assign a specific task to the best available node"""
         try:
             # Filter nodes by capability
-            suitable_nodes = [node for node in available_nodes if node.can_execute(task)]
-            if not suitable_nodes:
+            affinity = node_table.supports(task.service_name)
+            suitable = (node_table.cpu_cores >= task.cpu_cores) & (
+                node_table.memory_mb >= task.memory_mb
+            )
+            if task.service_name:
+                suitable &= affinity
+            candidates = np.flatnonzero(suitable)
+            if not candidates.size:
                 logger.warning(f"No suitable nodes for task {task.task_id}")
                 return None
 
             # Score nodes for this task
-            scored_nodes = []
-            for node in suitable_nodes:
-                score = self._calculate_node_score(node, task)
-                scored_nodes.append((score, node))
-
-            # Sort by score (highest first)
-            scored_nodes.sort(reverse=True)
+            scores = self._calculate_node_scores(node_table, task, affinity)
 
             # Try to assign to best node
-            for score, node in scored_nodes:
-                if await self._can_assign_to_node(node.node_id, task):
+            for index in self._rank_candidates(candidates, scores):
+                node = node_table.nodes[index]
+                if self._can_assign_to_node(node.node_id, task):
+                    assigned_at = datetime.utcnow()
                     assignment = TaskAssignment(
-                        task_id=task.task_id, node_id=node.node_id, priority=task.priority
+                        task_id=task.task_id,
+                        node_id=node.node_id,
+                        assigned_at=assigned_at,
+                        priority=task.priority,
                     )
 
                     # Update task status
                     task.status = TaskStatus.ASSIGNED
                     task.assigned_node_id = node.node_id
-                    task.assigned_at = datetime.utcnow()
+                    task.assigned_at = assigned_at
 
                     # Track assignment
                     self.task_assignments[task.task_id] = assignment
-                    if node.node_id not in self.node_assignments:
-                        self.node_assignments[node.node_id] = []
-                    self.node_assignments[node.node_id].append(assignment)
+                    self.node_assignments[node.node_id].add(task.task_id)
+                    self._node_load[node.node_id] += 1
+                    node_table.load[index] += 1
 
                     logger.info(
-                        f"Assigned task {task.task_id} to node {node.node_id} (score: {score:.2f})"
+                        f"Assigned task {task.task_id} to node {node.node_id} "
+                        f"(score: {scores[index]:.2f})"
                     )
                     return assignment
 
@@ -213,42 +438,52 @@ class TaskScheduler:
             logger.error(f"Error assigning task {task.task_id}: {e}")
             return None
 
-    def _calculate_node_score(self, node: NodeCapability, task: Task) -> float:
-        """Calculate node score for task assignment"""
-        score = 0.0
-
-        # Base capability score
-        score += node.get_score()
+    def _rank_candidates(self, candidates: np.ndarray, scores: np.ndarray):
+        """
+        Yield candidate node indices best first.
+
+        The first node usually accepts the task, so only the top few
+        candidates are partitioned out and sorted; the batch size doubles
+        whenever every node in the previous batch was rejected. Candidates
+        are ordered by (-score, node index) records, so equal scores rank
+        in node order even across batches.
+        """
+        remaining = np.empty(candidates.size, dtype=_RANK_KEY)
+        remaining["neg_score"] = -scores[candidates]
+        remaining["index"] = candidates
+        batch_size = _INITIAL_CANDIDATES
+        while remaining.size:
+            if batch_size < remaining.size:
+                remaining.partition(batch_size - 1)
+                batch, remaining = remaining[:batch_size], remaining[batch_size:]
+            else:
+                batch, remaining = remaining, remaining[:0]
+            batch.sort()
+            yield from batch["index"]
+            batch_size *= 2
+
+    def _calculate_node_scores(
+        self, node_table: _NodeTable, task: Task, affinity: np.ndarray
+    ) -> np.ndarray:
+        """Calculate the score of every node in the table for task assignment"""
+        scores = node_table.scores
 
         # Load balancing (fewer current assignments = higher score)
-        current_load = len(self.node_assignments.get(node.node_id, []))
-        load_penalty = current_load * 10
-        score -= load_penalty
+        np.multiply(node_table.load, node_table.load_weight, out=scores)
 
-        # Reputation weighting
-        if self.enable_reputation_weighting and node.reputation_score:
-            score += node.reputation_score * 0.5
+        # Capability, reputation and performance history, fixed for the pass
+        scores += node_table.base_score
 
         # Service affinity (nodes that support the specific service get bonus)
-        if task.service_name in node.supported_services:
-            score += 100
-
-        # Performance history
-        if node.success_rate:
-            score += node.success_rate * 50
-        if node.avg_execution_time:
-            score += max(0, 100 - node.avg_execution_time)
+        np.add(scores, node_table.affinity_bonus, out=scores, where=affinity)
 
-        # Random factor to prevent ties
-        score += random.uniform(0, 1)
+        # Ties are broken by node order when candidates are ranked
+        return scores
 
-        return score
-
-    async def _can_assign_to_node(self, node_id: str, task: Task) -> bool:
+    def _can_assign_to_node(self, node_id: str, task: Task) -> bool:
         """Check if node can accept the task assignment"""
         # Check current load
-        current_assignments = self.node_assignments.get(node_id, [])
-        if len(current_assignments) >= self.max_tasks_per_node:
+        if self._node_load.get(node_id, 0) >= self.max_tasks_per_node:
             return False
 
         # Check for duplicate assignment
@@ -257,45 +492,9 @@ class TaskScheduler:
 
         return True
 
-    def _update_metrics(self):
-        """Update scheduling metrics"""
-        total_assignments = sum(len(assignments) for assignments in self.node_assignments.values())
-        self.metrics.load_distribution = {
-            node_id: len(assignments) for node_id, assignments in self.node_assignments.items()
-        }
-
     def _get_mock_nodes(self) -> List[NodeCapability]:
         """Return mock nodes for testing"""
-        return [
-            NodeCapability(
-                node_id="node_001",
-                cpu_cores=4,
-                memory_mb=8192,
-                storage_gb=100,
-                supported_services=["image_upscaler_v1", "text_processor"],
-                reputation_score=85.0,
-                success_rate=0.95,
-            ),
-            NodeCapability(
-                node_id="node_002",
-                cpu_cores=8,
-                memory_mb=16384,
-                storage_gb=200,
-                gpu_enabled=True,
-                supported_services=["machine_learning", "data_analysis"],
-                reputation_score=92.0,
-                success_rate=0.98,
-            ),
-            NodeCapability(
-                node_id="node_003",
-                cpu_cores=2,
-                memory_mb=4096,
-                storage_gb=50,
-                supported_services=["api_call", "batch_processing"],
-                reputation_score=75.0,
-                success_rate=0.88,
-            ),
-        ]
+        return list(_MOCK_NODES)
 
     def get_scheduling_stats(self) -> Dict[str, Any]:
         """Get current scheduling statistics"""
@@ -304,29 +503,55 @@ class TaskScheduler:
             "assigned_tasks": self.metrics.assigned_tasks,
             "failed_assignments": self.metrics.failed_assignments,
             "success_rate": self.metrics.assigned_tasks / max(self.metrics.total_tasks, 1),
-            "load_distribution": self.metrics.load_distribution,
-            "queue_sizes": {
-                priority: len(queue) for priority, queue in self.priority_queues.items()
-            },
+            "load_distribution": dict(self.metrics.load_distribution),
+            "queue_sizes": self._queue_sizes(),
         }
 
+    def _queue_sizes(self) -> Dict[int, int]:
+        """Count queued tasks per priority level"""
+        sizes = dict.fromkeys(range(1, 6), 0)
+        for entry in self._heap:
+            if entry[-1].task_id not in self._cancelled:
+                sizes[_entry_priority(entry)] += 1
+        return sizes
+
+    def _queue_full(self) -> bool:
+        """Whether the queue has reached max_queue_size live tasks"""
+        return len(self._queued) >= self.max_queue_size
+
+    def _release_submitters(self):
+        """Wake submitters blocked on a full queue once it has drained enough"""
+        if (
+            self._queue_drained is not None
+            and len(self._queued) < self.max_queue_size * _QUEUE_RESUME_FRACTION
+        ):
+            self._queue_drained.set()
+
+    def _compact_queue(self):
+        """Drop cancelled entries from the priority queue in one pass"""
+        self._heap = [entry for entry in self._heap if entry[-1].task_id not in self._cancelled]
+        heapq.heapify(self._heap)
+        self._cancelled.clear()
+
     async def cancel_task(self, task_id: str) -> bool:
         """Cancel a pending task"""
         try:
-            # Remove from all priority queues
-            for priority, queue in self.priority_queues.items():
-                self.priority_queues[priority] = [
-                    item for item in queue if getattr(item[2], "task_id", None) != task_id
-                ]
+            # Tombstone the queued entry; it is skipped when popped
+            if task_id in self._queued:
+                self._queued.discard(task_id)
+                self._cancelled.add(task_id)
+                if (
+                    len(self._heap) >= _MIN_COMPACT_SIZE
+                    and len(self._cancelled) > len(self._heap) * _CANCELLED_COMPACT_FRACTION
+                ):
+                    self._compact_queue()
+                self._release_submitters()
 
             # Remove from assignments
             if task_id in self.task_assignments:
-                assignment = self.task_assignments[task_id]
-                if assignment.node_id in self.node_assignments:
-                    self.node_assignments[assignment.node_id] = [
-                        a for a in self.node_assignments[assignment.node_id] if a.task_id != task_id
-                    ]
-                del self.task_assignments[task_id]
+                assignment = self.task_assignments.pop(task_id)
+                self.node_assignments[assignment.node_id].discard(task_id)
+                self._node_load[assignment.node_id] -= 1
 
             logger.info(f"Task {task_id} cancelled")
             return True
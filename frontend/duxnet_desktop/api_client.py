@@ -8,6 +8,9 @@ from typing import Any, Dict, List, Optional
 
 import requests
 
+from .http_session import SESSION, response_json
+from .response_cache import memoize
+
 STORE_API_URL = "http://localhost:8000"  # Can be made configurable
 
 
@@ -15,12 +18,17 @@ class StoreApiClient:
     def register_service(self, service_data: dict, owner_id: str, owner_name: str) -> dict:
         """Register a new API/service in the store."""
         params = {"owner_id": owner_id, "owner_name": owner_name}
-        response = requests.post(f"{self.base_url}/services", json=service_data, params=params)
+        response = self.session.post(f"{self.base_url}/services", json=service_data, params=params)
         response.raise_for_status()
-        return response.json()
-    def __init__(self, base_url: str = STORE_API_URL):
+        self.search_services.cache_clear()
+        self.get_categories.cache_clear()
+        self.get_statistics.cache_clear()
+        return response_json(response)
+    def __init__(self, base_url: str = STORE_API_URL, session: Optional[requests.Session] = None):
         self.base_url = base_url.rstrip("/")
+        self.session = session or SESSION
 
+    @memoize(stale_ms=5000, ttl_ms=60000)
     def search_services(
         self,
         query: str = "",
@@ -44,51 +52,51 @@ class StoreApiClient:
             "limit": limit,
             "offset": offset,
         }
-        response = requests.get(f"{self.base_url}/services", params=params)
-        response.raise_for_status()
-        return response.json()
+        response = self.session.get(f"{self.base_url}/services", params=params)
+        return response_json(response)
 
     def get_service(self, service_id: str) -> Dict[str, Any]:
-        response = requests.get(f"{self.base_url}/services/{service_id}")
-        response.raise_for_status()
-        return response.json()
+        response = self.session.get(f"{self.base_url}/services/{service_id}")
+        return response_json(response)
 
     def get_service_reviews(
         self, service_id: str, limit: int = 20, offset: int = 0
     ) -> List[Dict[str, Any]]:
         params = {"limit": limit, "offset": offset}
-        response = requests.get(f"{self.base_url}/services/{service_id}/reviews", params=params)
-        response.raise_for_status()
-        return response.json()
+        response = self.session.get(f"{self.base_url}/services/{service_id}/reviews", params=params)
+        return response_json(response)
 
     def add_review(
         self, service_id: str, user_id: str, user_name: str, rating: int, title: str, content: str
     ) -> Dict[str, Any]:
         payload = {"rating": rating, "title": title, "content": content}
         params = {"user_id": user_id, "user_name": user_name}
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/services/{service_id}/reviews", json=payload, params=params
         )
         response.raise_for_status()
-        return response.json()
+        # Ratings feed into search results and store statistics
+        self.search_services.cache_clear()
+        self.get_statistics.cache_clear()
+        return response_json(response)
 
     def get_user_favorites(self, user_id: str) -> List[Dict[str, Any]]:
-        response = requests.get(f"{self.base_url}/users/{user_id}/favorites")
-        response.raise_for_status()
-        return response.json()
+        response = self.session.get(f"{self.base_url}/users/{user_id}/favorites")
+        return response_json(response)
 
     def toggle_favorite(self, service_id: str, user_id: str) -> Dict[str, Any]:
         params = {"user_id": user_id}
-        response = requests.post(f"{self.base_url}/services/{service_id}/favorite", params=params)
-        response.raise_for_status()
-        return response.json()
+        response = self.session.post(
+            f"{self.base_url}/services/{service_id}/favorite", params=params
+        )
+        return response_json(response)
 
+    @memoize(stale_ms=60000, ttl_ms=600000)
     def get_categories(self) -> List[str]:
-        response = requests.get(f"{self.base_url}/categories")
-        response.raise_for_status()
-        return response.json()
+        response = self.session.get(f"{self.base_url}/categories")
+        return response_json(response)
 
+    @memoize(stale_ms=5000, ttl_ms=60000)
     def get_statistics(self) -> Dict[str, Any]:
-        response = requests.get(f"{self.base_url}/statistics")
-        response.raise_for_status()
-        return response.json()
+        response = self.session.get(f"{self.base_url}/statistics")
+        return response_json(response)
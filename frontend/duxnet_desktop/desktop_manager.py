@@ -5,6 +5,7 @@ DuxOS Desktop App Main Entry Point
 Launches the main window for the DuxOS API/App Store desktop application.
 """
 
+import logging
 import sys
 
 from PyQt5.QtWidgets import QApplication
@@ -13,19 +14,17 @@ from frontend.duxnet_desktop.api_client import StoreApiClient
 from frontend.duxnet_desktop.ui.main_window import MainWindow
 from frontend.duxnet_desktop.wallet_client import WalletClient
 
+logger = logging.getLogger(__name__)
+
 
 def main():
-    print("Starting DuxNet Desktop Manager...")
+    logger.debug("Starting DuxNet Desktop Manager")
     app = QApplication(sys.argv)
-    print("QApplication created")
     api_client = StoreApiClient()
-    print("StoreApiClient created")
     wallet_client = WalletClient()
-    print("WalletClient created")
     window = MainWindow(api_client, wallet_client)
-    print("MainWindow created")
     window.show()
-    print("Window shown, entering event loop")
+    logger.debug("Window shown, entering event loop")
     sys.exit(app.exec_())
 
 
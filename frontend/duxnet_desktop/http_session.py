@@ -0,0 +1,90 @@
+"""
+Shared HTTP Session for DuxOS Desktop
+
+Keeps pooled keep-alive connections to the local DuxOS services so the
+desktop API clients do not reconnect on every request, and decodes their
+JSON responses with orjson when it is installed.
+"""
+
+import json
+from typing import Any, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# (connect, read) seconds; a hung service must not tie up a worker thread for good
+DEFAULT_TIMEOUT = (3, 10)
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default timeout to requests that do not set one"""
+
+    def __init__(self, *args, timeout: Tuple[float, float] = DEFAULT_TIMEOUT, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def create_session(pool_maxsize: int = 32) -> requests.Session:
+    """Create a session with a connection pool, timeouts and retries for idempotent requests"""
+    session = requests.Session()
+    # Failed connects are retried for every method, since nothing was sent yet.
+    # Read errors and gateway statuses are only retried for idempotent methods;
+    # Retry's default method list excludes POST, so payments are never resent.
+    # Once retries run out the last response is returned, so callers still see
+    # it through raise_for_status().
+    adapter = TimeoutHTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=4,
+            connect=3,
+            read=1,
+            status=2,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def loads_json(data) -> Any:
+    """Decode a JSON document from str or bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def response_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, raising HTTPError for an error status"""
+    if response.status_code >= 400:
+        response.raise_for_status()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def pretty_json(data: Any) -> str:
+    """Format data as JSON indented by two spaces"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+SESSION = create_session()
@@ -0,0 +1,121 @@
+"""
+Response Cache for DuxOS Desktop
+
+Stale-while-revalidate memoization for slow-changing API client calls.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+
+class _Fetch:
+    """Outcome of an inline fetch, for callers that arrive while it runs"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+    def wait(self):
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+def memoize(stale_ms: int = 5000, ttl_ms: int = 60000, max_size: int = 1000):
+    """
+    Cache a function's results per arguments.
+
+    Results younger than stale_ms are returned as is. Older results are still
+    returned immediately, until they reach ttl_ms, while a background thread
+    fetches a fresh value. Expired or missing results are fetched inline;
+    concurrent calls for the same arguments share that one fetch.
+    The wrapper's cache_clear() drops all results, e.g. after a user action
+    that is known to change them. Calls with unhashable arguments (such as
+    a list of tags) are not cached.
+    """
+
+    def decorator(fn):
+        cache = OrderedDict()  # key -> (value, stored_at), least recently used first
+        refreshing = set()
+        fetching = {}  # key -> _Fetch shared by callers waiting on an inline fetch
+        lock = threading.Lock()
+        generation = [0]  # bumped by cache_clear so in-flight refreshes are discarded
+
+        def store(key, value, fetched_generation):
+            with lock:
+                if fetched_generation != generation[0]:
+                    return
+                cache[key] = (value, time.monotonic())
+                cache.move_to_end(key)
+                while len(cache) > max_size:
+                    cache.popitem(last=False)
+
+        def revalidate(key, args, kwargs, fetched_generation):
+            try:
+                store(key, fn(*args, **kwargs), fetched_generation)
+            except Exception as e:
+                print(f"Error refreshing {fn.__name__}: {e}")
+            finally:
+                with lock:
+                    refreshing.discard(key)
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            try:
+                hash(key)
+            except TypeError:
+                return fn(*args, **kwargs)
+            with lock:
+                fetched_generation = generation[0]
+                entry = cache.get(key)
+                if entry is not None:
+                    value, stored_at = entry
+                    age_ms = (time.monotonic() - stored_at) * 1000
+                    if age_ms < ttl_ms:
+                        cache.move_to_end(key)
+                        if age_ms >= stale_ms and key not in refreshing:
+                            refreshing.add(key)
+                            threading.Thread(
+                                target=revalidate,
+                                args=(key, args, kwargs, fetched_generation),
+                                daemon=True,
+                            ).start()
+                        return value
+                fetch = fetching.get(key)
+                owner = fetch is None
+                if owner:
+                    fetch = fetching[key] = _Fetch()
+
+            if not owner:
+                return fetch.wait()
+            try:
+                value = fn(*args, **kwargs)
+            except BaseException as e:
+                fetch.error = e
+                raise
+            else:
+                fetch.value = value
+                store(key, value, fetched_generation)
+                return value
+            finally:
+                with lock:
+                    if fetching.get(key) is fetch:
+                        del fetching[key]
+                fetch.done.set()
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+                # Later callers must not join fetches that started before the change
+                fetching.clear()
+                generation[0] += 1
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
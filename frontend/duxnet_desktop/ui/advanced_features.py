@@ -5,8 +5,21 @@ Provides integration with multi-crypto wallet, escrow management,
 task engine, and daemon management features.
 """
 
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QThread
-from PyQt5.QtGui import QFont, QIcon
+from PyQt5.QtCore import (
+    Qt,
+    pyqtSignal,
+    pyqtSlot,
+    QAbstractTableModel,
+    QCoreApplication,
+    QEvent,
+    QModelIndex,
+    QObject,
+    QRect,
+    QTimer,
+    QThread,
+    QUrl,
+)
+from PyQt5.QtGui import QColor, QFont, QIcon
 from PyQt5.QtWidgets import (
     QTabWidget,
     QVBoxLayout,
@@ -31,23 +44,488 @@ from PyQt5.QtWidgets import (
     QCheckBox,
     QListWidget,
     QListWidgetItem,
+    QApplication,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionButton,
+    QStyleOptionProgressBar,
+    QTableView,
 )
 
-import json
-import requests
+try:
+    from PyQt5.QtWebSockets import QWebSocket
+
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    WEBSOCKETS_AVAILABLE = False
+
+import random
+import time
+from collections import deque
+from functools import partial
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from frontend.duxnet_desktop.http_session import SESSION, loads_json, pretty_json, response_json
+from frontend.duxnet_desktop.response_cache import memoize
+from frontend.duxnet_desktop.wallet_client import CURRENCIES
+
+TASK_TYPES = ("API_CALL", "BATCH_PROCESSING", "MACHINE_LEARNING", "DATA_ANALYSIS", "IMAGE_PROCESSING")
+DAEMONS = ("bitcoind", "ethereumd", "flopcoind", "litecoind", "dogecoind")
+
+format_amount = "{:.8f}".format
+
+MAX_HISTORY = 500  # transaction history rows kept in memory and on screen
+
+
+class RpcWorker(QObject):
+    """Runs blocking client calls on a background QThread"""
+    
+    call_requested = pyqtSignal(str, object)  # request token, zero-argument callable
+    call_finished = pyqtSignal(str, object)  # request token, result
+    call_failed = pyqtSignal(str, str)  # request token, error message
+    
+    def __init__(self, superseded):
+        super().__init__()
+        self.superseded = superseded  # tokens of queued calls that no longer need to run
+        # Emitted from the GUI thread, so the call is queued onto this worker's thread
+        self.call_requested.connect(self.run_call)
+    
+    @pyqtSlot(str, object)
+    def run_call(self, token, fetch):
+        if token in self.superseded:
+            self.call_finished.emit(token, None)
+            return
+        try:
+            result = fetch()
+        except Exception as e:
+            self.call_failed.emit(token, str(e))
+        else:
+            self.call_finished.emit(token, result)
+
+
+class BackgroundRpc(QObject):
+    """
+    Dispatches client calls to a small pool of RpcWorker threads so network
+    I/O never blocks the GUI thread and independent calls overlap instead of
+    queueing behind each other. Result and error callbacks run on the GUI
+    thread, and only for the latest call made under each key.
+    """
+    
+    def __init__(self, parent=None, max_workers=2):
+        super().__init__(parent)
+        self.pending = {}  # request token -> (key, on_result, on_error, worker)
+        self.latest = {}  # request key -> token of the call whose result is wanted
+        self.superseded = set()
+        self.generation = 0
+        self.load = {}  # worker -> number of calls queued on it
+        self.worker_threads = []
+        for _ in range(max_workers):
+            worker_thread = QThread(self)
+            worker = RpcWorker(self.superseded)
+            worker.moveToThread(worker_thread)
+            worker.call_finished.connect(self.on_call_finished)
+            worker.call_failed.connect(self.on_call_failed)
+            worker_thread.finished.connect(worker.deleteLater)
+            self.load[worker] = 0
+            self.worker_threads.append(worker_thread)
+            worker_thread.start()
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop)
+    
+    def call(self, key, fetch, on_result, on_error, supersede=False):
+        """
+        Run fetch() in the background. While a call with the same key is in
+        flight, a new call is skipped, or with supersede=True (e.g. after a
+        change the in-flight result may predate) it replaces the old call,
+        whose result is then dropped.
+        """
+        if key in self.latest:
+            if not supersede:
+                return False
+            self.superseded.add(self.latest[key])
+        self.generation += 1
+        token = f"{key}#{self.generation}"
+        worker = min(self.load, key=self.load.get)
+        self.load[worker] += 1
+        self.pending[token] = (key, on_result, on_error, worker)
+        self.latest[key] = token
+        worker.call_requested.emit(token, fetch)
+        return True
+    
+    def finish(self, token):
+        """Forget a returned call; True if its result is still wanted"""
+        key, _, _, worker = self.pending[token]
+        self.load[worker] -= 1
+        self.superseded.discard(token)
+        if self.latest.get(key) != token:
+            del self.pending[token]
+            return False
+        del self.latest[key]
+        return True
+    
+    def on_call_finished(self, token, result):
+        if self.finish(token):
+            _, on_result, _, _ = self.pending.pop(token)
+            on_result(result)
+    
+    def on_call_failed(self, token, error):
+        if self.finish(token):
+            _, _, on_error, _ = self.pending.pop(token)
+            on_error(error)
+    
+    def stop(self):
+        """Stop the worker threads once their current calls return"""
+        for worker_thread in self.worker_threads:
+            worker_thread.quit()
+        for worker_thread in self.worker_threads:
+            worker_thread.wait()
+
+
+class RefreshScheduler(QObject):
+    """
+    Drives the periodic refreshes of several widgets from one timer tick.
+    Refreshes of widgets that are not visible (e.g. inactive tabs) are
+    skipped and run on the first tick after the widget is shown again.
+    """
+    
+    def __init__(self, parent=None, tick_ms=1000):
+        super().__init__(parent)
+        self.entries = []
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.tick)
+        self.timer.start(tick_ms)
+    
+    def register(self, callback, interval_ms, widget=None, jitter=0.0):
+        """
+        Call callback every interval_ms while widget (if given) is visible.
+        With jitter, each wait is randomly stretched or shortened by up to
+        that fraction of the interval, so many clients polling the same
+        service do not all hit it at once.
+        """
+        entry = {
+            'callback': callback,
+            'interval': interval_ms / 1000.0,
+            'jitter': jitter,
+            'widget': widget,
+        }
+        entry['next_due'] = self.next_due(entry, time.monotonic())
+        self.entries.append(entry)
+    
+    def next_due(self, entry, now):
+        spread = entry['interval'] * entry['jitter']
+        return now + entry['interval'] + random.uniform(-spread, spread)
+    
+    def set_interval(self, callback, interval_ms):
+        """Change how often a registered callback runs"""
+        for entry in self.entries:
+            if entry['callback'] == callback:
+                entry['interval'] = interval_ms / 1000.0
+                entry['next_due'] = min(entry['next_due'], self.next_due(entry, time.monotonic()))
+    
+    def tick(self):
+        now = time.monotonic()
+        for entry in self.entries:
+            if now < entry['next_due']:
+                continue
+            if entry['widget'] is not None and not entry['widget'].isVisible():
+                continue
+            entry['next_due'] = self.next_due(entry, now)
+            entry['callback']()
+
+
+class EventSubscription(QObject):
+    """
+    Receives JSON records pushed by a service over a WebSocket, reconnecting
+    with backoff. connected_changed reports whether pushes are live so
+    callers can slow their polling down while they are.
+    """
+    
+    record_received = pyqtSignal(object)  # decoded record dict
+    connected_changed = pyqtSignal(bool)
+    
+    def __init__(self, url, parent=None):
+        super().__init__(parent)
+        self.url = QUrl(url)
+        self.is_connected = False
+        self.retry_ms = 1000
+        self.retry_pending = False
+        self.socket = QWebSocket()
+        self.socket.setParent(self)
+        self.socket.connected.connect(self.on_connected)
+        self.socket.disconnected.connect(self.on_disconnected)
+        self.socket.error.connect(self.on_disconnected)
+        self.socket.textMessageReceived.connect(self.on_message)
+        self.socket.open(self.url)
+    
+    def on_connected(self):
+        self.is_connected = True
+        self.retry_ms = 1000
+        self.connected_changed.emit(True)
+    
+    def on_disconnected(self, *args):
+        if self.is_connected:
+            self.is_connected = False
+            self.connected_changed.emit(False)
+        if not self.retry_pending:
+            self.retry_pending = True
+            QTimer.singleShot(self.retry_ms, self.reconnect)
+            self.retry_ms = min(self.retry_ms * 2, 60000)
+    
+    def reconnect(self):
+        self.retry_pending = False
+        self.socket.open(self.url)
+    
+    def on_message(self, message):
+        try:
+            record = loads_json(message)
+        except ValueError as e:
+            print(f"Ignoring malformed event from {self.url.toString()}: {e}")
+            return
+        if isinstance(record, dict):
+            self.record_received.emit(record)
+
+
+class LazyGroupBox(QGroupBox):
+    """
+    Collapsible group box whose contents are built by build(container) the
+    first time it is expanded, so rarely used forms cost nothing up front.
+    """
+    
+    def __init__(self, title, build, parent=None):
+        super().__init__(title, parent)
+        self.build = build
+        self.content = None
+        QVBoxLayout(self)
+        self.setCheckable(True)
+        self.setChecked(False)
+        self.toggled.connect(self.set_expanded)
+    
+    def set_expanded(self, expanded):
+        if expanded and self.content is None:
+            self.content = QWidget()
+            self.build(self.content)
+            self.layout().addWidget(self.content)
+        if self.content is not None:
+            self.content.setVisible(expanded)
+
+
+class RecordTableModel(QAbstractTableModel):
+    """
+    Table model over a list of dict records identified by key_field.
+    
+    update() diffs the new records against the current ones by key, so a
+    refresh only inserts, removes, moves and repaints the rows that changed
+    instead of rebuilding the whole table, and selections stay on their rows.
+    Display text is formatted once per record and reused on every repaint.
+    Records may be partial, so column callbacks read fields with .get():
+    they run inside Qt's paint path, where an exception aborts the app.
+    """
+    
+    def __init__(self, columns, key_field, background=None, parent=None,
+                 foreground=None, tooltip=None):
+        super().__init__(parent)
+        self.columns = columns  # [(header, record -> display text or None)]
+        self.key_field = key_field
+        self.background = background  # (record, column) -> QColor or None
+        self.foreground = foreground  # (record, column) -> QColor or None
+        self.tooltip = tooltip  # (record, column) -> text or None
+        self.rows = []
+        self.display_cache = {}  # key -> (record, display text per column)
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.columns[section][0]
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        record = self.rows[index.row()]
+        if role == Qt.DisplayRole:
+            return self.display_texts(record)[index.column()]
+        if role == Qt.BackgroundRole and self.background:
+            return self.background(record, index.column())
+        if role == Qt.ForegroundRole and self.foreground:
+            return self.foreground(record, index.column())
+        if role == Qt.ToolTipRole and self.tooltip:
+            return self.tooltip(record, index.column())
+        return None
+    
+    def display_texts(self, record):
+        key = record[self.key_field]
+        cached = self.display_cache.get(key)
+        if cached is None or cached[0] is not record:
+            texts = [display(record) if display else None for _, display in self.columns]
+            cached = self.display_cache[key] = (record, texts)
+        return cached[1]
+    
+    def record(self, row):
+        return self.rows[row]
+    
+    def upsert(self, record):
+        """Insert or update a single record by key"""
+        key = record.get(self.key_field)
+        if key is None:
+            return
+        for row, current in enumerate(self.rows):
+            if current[self.key_field] == key:
+                if current != record:
+                    self.rows[row] = record
+                    self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.columns) - 1))
+                return
+        self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows))
+        self.rows.append(record)
+        self.endInsertRows()
+    
+    def update(self, records):
+        """Replace the model contents, notifying views only about changed rows"""
+        key_field = self.key_field
+        # Records without a key cannot be shown or matched up; drop them
+        records = [record for record in records if record.get(key_field) is not None]
+        new_keys = [record[key_field] for record in records]
+        if len(set(new_keys)) != len(new_keys):
+            # Rows cannot be matched up by key
+            self.beginResetModel()
+            self.rows = records
+            self.display_cache.clear()
+            self.endResetModel()
+            return
+        
+        # Drop rows that disappeared, bottom-up so row numbers stay valid
+        new_key_set = set(new_keys)
+        for row in reversed(range(len(self.rows))):
+            if self.rows[row][key_field] not in new_key_set:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                self.display_cache.pop(self.rows[row][key_field], None)
+                del self.rows[row]
+                self.endRemoveRows()
+        
+        # Append rows for new keys; they are moved into place below
+        current_keys = {record[key_field] for record in self.rows}
+        added = [record for record in records if record[key_field] not in current_keys]
+        if added:
+            first = len(self.rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            self.rows.extend(added)
+            self.endInsertRows()
+        
+        # Reorder in place so selections and other persistent indexes follow their rows
+        if [record[key_field] for record in self.rows] != new_keys:
+            self.layoutAboutToBeChanged.emit()
+            new_row = {key: row for row, key in enumerate(new_keys)}
+            old_indexes = self.persistentIndexList()
+            new_indexes = [
+                self.index(new_row[self.rows[index.row()][key_field]], index.column())
+                for index in old_indexes
+            ]
+            by_key = {record[key_field]: record for record in self.rows}
+            self.rows = [by_key[key] for key in new_keys]
+            self.changePersistentIndexList(old_indexes, new_indexes)
+            self.layoutChanged.emit()
+        
+        last_column = len(self.columns) - 1
+        for row, record in enumerate(records):
+            if self.rows[row] != record:
+                self.rows[row] = record
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+
+
+class ActionButtonDelegate(QStyledItemDelegate):
+    """Paints per-row action buttons and handles their clicks without cell widgets"""
+    
+    def __init__(self, actions, parent=None):
+        super().__init__(parent)
+        self.actions = actions  # record -> [(label, slot taking the record's key)]
+    
+    def button_rects(self, rect, count):
+        width = rect.width() // max(count, 1)
+        return [QRect(rect.x() + i * width, rect.y(), width, rect.height()) for i in range(count)]
+    
+    def paint(self, painter, option, index):
+        buttons = self.actions(index.model().record(index.row()))
+        style = option.widget.style() if option.widget else QApplication.style()
+        for (label, _), rect in zip(buttons, self.button_rects(option.rect, len(buttons))):
+            button = QStyleOptionButton()
+            button.rect = rect.adjusted(2, 2, -2, -2)
+            button.text = label
+            button.state = QStyle.State_Enabled | QStyle.State_Raised
+            style.drawControl(QStyle.CE_PushButton, button, painter)
+    
+    def editorEvent(self, event, model, option, index):
+        if event.type() != QEvent.MouseButtonRelease or event.button() != Qt.LeftButton:
+            return False
+        record = model.record(index.row())
+        key = record[model.key_field]
+        buttons = self.actions(record)
+        for (_, callback), rect in zip(buttons, self.button_rects(option.rect, len(buttons))):
+            if rect.contains(event.pos()):
+                # Run after the event returns; actions may open dialogs
+                QTimer.singleShot(0, partial(callback, key))
+                return True
+        return False
+
+
+class ProgressBarDelegate(QStyledItemDelegate):
+    """
+    Paints a progress bar from the cell's percentage instead of a
+    QProgressBar cell widget. The percentage is the column's display value,
+    so the model computes it once per record.
+    """
+    
+    def paint(self, painter, option, index):
+        progress = int(index.data() or 0)
+        bar = QStyleOptionProgressBar()
+        bar.rect = option.rect.adjusted(2, 2, -2, -2)
+        bar.minimum = 0
+        bar.maximum = 100
+        bar.progress = progress
+        bar.text = f"{progress}%"
+        bar.textVisible = True
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ProgressBar, bar, painter)
+
+
+def make_record_table(model, parent=None):
+    """Create a stretched QTableView showing the model"""
+    view = QTableView(parent)
+    view.setModel(model)
+    view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+    return view
+
+
+def update_record_table(view, records):
+    """
+    Apply records to the view's RecordTableModel with painting suspended,
+    so the inserts, moves and changes of one refresh cost a single repaint
+    and header layout pass instead of one per row.
+    """
+    view.setUpdatesEnabled(False)
+    try:
+        view.model().update(records)
+    finally:
+        view.setUpdatesEnabled(True)
+
 
 class MultiCryptoWalletWidget(QWidget):
     """Multi-cryptocurrency wallet management widget"""
     
-    def __init__(self, wallet_client, parent=None):
+    def __init__(self, wallet_client, parent=None, refresh_scheduler=None):
         super().__init__(parent)
         self.wallet_client = wallet_client
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.refresh_balances)
-        self.refresh_timer.start(30000)  # Refresh every 30 seconds
+        self.rpc = BackgroundRpc(self)
+        self.pending_balance_refresh = set()
+        self.history = deque(maxlen=MAX_HISTORY)  # (date, currency, type, amount, status)
+        self.history_table = None
+        self.refresh_scheduler = refresh_scheduler or RefreshScheduler(self)
+        self.refresh_scheduler.register(self.refresh_balances, 30000, self)  # Refresh every 30 seconds
         self.setup_ui()
         self.refresh_balances()
     
@@ -63,20 +541,36 @@ class MultiCryptoWalletWidget(QWidget):
         balances_group = QGroupBox("Wallet Balances")
         balances_layout = QVBoxLayout(balances_group)
         
-        self.balances_table = QTableWidget()
-        self.balances_table.setColumnCount(4)
-        self.balances_table.setHorizontalHeaderLabels(["Currency", "Balance", "Address", "Actions"])
-        self.balances_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.balances_model = RecordTableModel(
+            [
+                ("Currency", lambda b: b.get('currency', '')),
+                ("Balance", lambda b: format_amount(b.get('balance', 0))),
+                ("Address", lambda b: b.get('address', 'N/A')),
+                ("Actions", None),
+            ],
+            key_field='currency',
+            parent=self,
+        )
+        self.balances_table = make_record_table(self.balances_model)
+        self.balances_table.setItemDelegateForColumn(
+            3, ActionButtonDelegate(self.balance_actions, self.balances_table)
+        )
         balances_layout.addWidget(self.balances_table)
         
         layout.addWidget(balances_group)
         
-        # Send transaction section
-        send_group = QGroupBox("Send Transaction")
-        send_layout = QFormLayout(send_group)
+        # Send transaction section, built when first expanded
+        layout.addWidget(LazyGroupBox("Send Transaction", self.build_send_form))
+        
+        # Transaction history, built when first expanded
+        layout.addWidget(LazyGroupBox("Transaction History", self.build_history_table))
+    
+    def build_send_form(self, container):
+        """Build the send transaction form"""
+        send_layout = QFormLayout(container)
         
         self.currency_combo = QComboBox()
-        self.currency_combo.addItems(["BTC", "ETH", "FLOP", "USDT", "BNB", "XRP", "SOL", "ADA", "DOGE", "TON", "TRX"])
+        self.currency_combo.addItems(CURRENCIES)
         send_layout.addRow("Currency:", self.currency_combo)
         
         self.to_address_input = QLineEdit()
@@ -91,12 +585,10 @@ class MultiCryptoWalletWidget(QWidget):
         self.send_button = QPushButton("Send Transaction")
         self.send_button.clicked.connect(self.send_transaction)
         send_layout.addRow("", self.send_button)
-        
-        layout.addWidget(send_group)
-        
-        # Transaction history
-        history_group = QGroupBox("Transaction History")
-        history_layout = QVBoxLayout(history_group)
+    
+    def build_history_table(self, container):
+        """Build the transaction history table"""
+        history_layout = QVBoxLayout(container)
         
         self.history_table = QTableWidget()
         self.history_table.setColumnCount(5)
@@ -104,39 +596,79 @@ class MultiCryptoWalletWidget(QWidget):
         self.history_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         history_layout.addWidget(self.history_table)
         
-        layout.addWidget(history_group)
+        for entry in self.history:
+            self.append_history_row(entry)
+    
+    def add_history_entry(self, entry):
+        """Record a transaction, dropping the oldest beyond MAX_HISTORY"""
+        self.history.append(entry)
+        if self.history_table is not None:
+            self.append_history_row(entry)
+    
+    def append_history_row(self, entry):
+        if self.history_table.rowCount() >= MAX_HISTORY:
+            self.history_table.removeRow(0)
+        row = self.history_table.rowCount()
+        self.history_table.insertRow(row)
+        for column, value in enumerate(entry):
+            self.history_table.setItem(row, column, QTableWidgetItem(value))
     
-    def refresh_balances(self):
+    def refresh_balances(self, supersede=False):
         """Refresh wallet balances"""
+        # Get balances for all currencies
+        self.rpc.call(
+            "balances",
+            self.wallet_client.get_all_balances,
+            self.apply_balances,
+            lambda error: QMessageBox.warning(self, "Error", f"Failed to refresh balances: {error}"),
+            supersede=supersede,
+        )
+    
+    def apply_balances(self, balances):
+        """Show fetched balances in the table"""
         try:
-            # Get balances for all currencies
-            balances = self.wallet_client.get_all_balances()
-            
-            self.balances_table.setRowCount(len(balances))
-            for i, (currency, balance_info) in enumerate(balances.items()):
-                self.balances_table.setItem(i, 0, QTableWidgetItem(currency))
-                self.balances_table.setItem(i, 1, QTableWidgetItem(f"{balance_info['balance']:.8f}"))
-                self.balances_table.setItem(i, 2, QTableWidgetItem(balance_info.get('address', 'N/A')))
-                
-                # Add refresh button
-                refresh_btn = QPushButton("Refresh")
-                refresh_btn.clicked.connect(lambda checked, c=currency: self.refresh_currency_balance(c))
-                self.balances_table.setCellWidget(i, 3, refresh_btn)
-                
+            update_record_table(
+                self.balances_table,
+                [dict(balance_info, currency=currency) for currency, balance_info in balances.items()],
+            )
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to refresh balances: {e}")
     
+    def balance_actions(self, balance):
+        """Action buttons shown for a balance row"""
+        return [("Refresh", self.refresh_currency_balance)]
+    
     def refresh_currency_balance(self, currency):
         """Refresh balance for specific currency"""
-        try:
-            balance = self.wallet_client.get_balance(currency)
-            # Update the balance in the table
-            for i in range(self.balances_table.rowCount()):
-                if self.balances_table.item(i, 0).text() == currency:
-                    self.balances_table.item(i, 1).setText(f"{balance:.8f}")
-                    break
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to refresh {currency} balance: {e}")
+        # Clicks within 50 ms share one balances request
+        if not self.pending_balance_refresh:
+            QTimer.singleShot(50, self.flush_currency_refresh)
+        self.pending_balance_refresh.add(currency)
+    
+    def flush_currency_refresh(self):
+        """Refresh all currencies requested since the last flush in one request"""
+        currencies, self.pending_balance_refresh = self.pending_balance_refresh, set()
+        # An explicit refresh must not be answered from the response cache
+        self.wallet_client.get_all_balances.cache_clear()
+        names = ", ".join(sorted(currencies))
+        self.rpc.call(
+            "balances",
+            self.wallet_client.get_all_balances,
+            lambda balances: self.apply_currency_balances(currencies, balances),
+            lambda error: QMessageBox.warning(self, "Error", f"Failed to refresh {names} balance: {error}"),
+            supersede=True,
+        )
+    
+    def apply_currency_balances(self, currencies, balances):
+        """Update the table rows of the refreshed currencies"""
+        update_record_table(
+            self.balances_table,
+            [
+                dict(balances[b['currency']], currency=b['currency'])
+                if b['currency'] in currencies and b['currency'] in balances else b
+                for b in self.balances_model.rows
+            ],
+        )
     
     def send_transaction(self):
         """Send a transaction"""
@@ -157,13 +689,20 @@ class MultiCryptoWalletWidget(QWidget):
             txid = self.wallet_client.send_transaction(currency, to_address, amount)
             
             QMessageBox.information(self, "Success", f"Transaction sent! TXID: {txid}")
+            self.add_history_entry((
+                datetime.now().strftime("%Y-%m-%d %H:%M"),
+                currency,
+                "Send",
+                format_amount(amount),
+                "Pending",
+            ))
             
             # Clear inputs
             self.to_address_input.clear()
             self.amount_input.setValue(0.0)
             
             # Refresh balances
-            self.refresh_balances()
+            self.refresh_balances(supersede=True)
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to send transaction: {e}")
@@ -172,14 +711,25 @@ class MultiCryptoWalletWidget(QWidget):
 class EscrowManagementWidget(QWidget):
     """Escrow management and monitoring widget"""
     
-    def __init__(self, escrow_client, parent=None):
+    def __init__(self, escrow_client, parent=None, refresh_scheduler=None):
         super().__init__(parent)
         self.escrow_client = escrow_client
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.refresh_escrows)
-        self.refresh_timer.start(10000)  # Refresh every 10 seconds
+        self.rpc = BackgroundRpc(self)
+        self.refresh_scheduler = refresh_scheduler or RefreshScheduler(self)
+        self.refresh_scheduler.register(self.refresh_escrows, 10000, self)  # Refresh every 10 seconds
         self.setup_ui()
         self.refresh_escrows()
+        
+        # Escrow changes pushed by the service, when enabled; polling only
+        # reconciles while connected
+        if WEBSOCKETS_AVAILABLE and getattr(self.escrow_client, "push_events", False):
+            self.escrow_events = EventSubscription(self.escrow_client.events_url(), self)
+            self.escrow_events.record_received.connect(self.escrows_model.upsert)
+            self.escrow_events.connected_changed.connect(self.set_push_active)
+    
+    def set_push_active(self, active):
+        """Poll rarely while escrow updates are pushed"""
+        self.refresh_scheduler.set_interval(self.refresh_escrows, 60000 if active else 10000)
     
     def setup_ui(self):
         layout = QVBoxLayout(self)
@@ -193,12 +743,23 @@ class EscrowManagementWidget(QWidget):
         active_group = QGroupBox("Active Escrows")
         active_layout = QVBoxLayout(active_group)
         
-        self.escrows_table = QTableWidget()
-        self.escrows_table.setColumnCount(7)
-        self.escrows_table.setHorizontalHeaderLabels([
-            "ID", "Service", "Amount", "Status", "Created", "Provider", "Actions"
-        ])
-        self.escrows_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.escrows_model = RecordTableModel(
+            [
+                ("ID", lambda e: e.get('id', '')[:8]),
+                ("Service", lambda e: e.get('service_name', '')),
+                ("Amount", lambda e: format_amount(e.get('amount', 0))),
+                ("Status", lambda e: e.get('status', '')),
+                ("Created", lambda e: e.get('created_at', '')[:10]),
+                ("Provider", lambda e: e.get('provider_wallet_id', '')),
+                ("Actions", None),
+            ],
+            key_field='id',
+            parent=self,
+        )
+        self.escrows_table = make_record_table(self.escrows_model)
+        self.escrows_table.setItemDelegateForColumn(
+            6, ActionButtonDelegate(self.escrow_actions, self.escrows_table)
+        )
         active_layout.addWidget(self.escrows_table)
         
         layout.addWidget(active_group)
@@ -218,9 +779,12 @@ class EscrowManagementWidget(QWidget):
         
         layout.addWidget(fund_group)
         
-        # Create escrow section
-        create_group = QGroupBox("Create Escrow")
-        create_layout = QFormLayout(create_group)
+        # Create escrow section, built when first expanded
+        layout.addWidget(LazyGroupBox("Create Escrow", self.build_create_form))
+    
+    def build_create_form(self, container):
+        """Build the create escrow form"""
+        create_layout = QFormLayout(container)
         
         self.service_name_input = QLineEdit()
         self.service_name_input.setPlaceholderText("Enter service name")
@@ -238,47 +802,48 @@ class EscrowManagementWidget(QWidget):
         self.create_escrow_button = QPushButton("Create Escrow")
         self.create_escrow_button.clicked.connect(self.create_escrow)
         create_layout.addRow("", self.create_escrow_button)
-        
-        layout.addWidget(create_group)
     
-    def refresh_escrows(self):
-        """Refresh escrow list"""
+    def refresh_escrows(self, supersede=False):
+        """Refresh escrow list and community fund info"""
+        # Independent requests, so they run on separate workers at the same time
+        self.rpc.call(
+            "escrows",
+            self.escrow_client.get_active_escrows,
+            self.apply_escrows,
+            lambda error: QMessageBox.warning(self, "Error", f"Failed to refresh escrows: {error}"),
+            supersede=supersede,
+        )
+        self.rpc.call(
+            "community_fund",
+            self.escrow_client.get_community_fund_info,
+            self.apply_fund_info,
+            lambda error: QMessageBox.warning(self, "Error", f"Failed to refresh community fund: {error}"),
+            supersede=supersede,
+        )
+    
+    def apply_escrows(self, escrows):
+        """Show fetched escrows"""
+        try:
+            update_record_table(self.escrows_table, escrows)
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Failed to refresh escrows: {e}")
+    
+    def apply_fund_info(self, fund_info):
+        """Show fetched community fund info"""
         try:
-            escrows = self.escrow_client.get_active_escrows()
-            
-            self.escrows_table.setRowCount(len(escrows))
-            for i, escrow in enumerate(escrows):
-                self.escrows_table.setItem(i, 0, QTableWidgetItem(escrow['id'][:8]))
-                self.escrows_table.setItem(i, 1, QTableWidgetItem(escrow['service_name']))
-                self.escrows_table.setItem(i, 2, QTableWidgetItem(f"{escrow['amount']:.8f}"))
-                self.escrows_table.setItem(i, 3, QTableWidgetItem(escrow['status']))
-                self.escrows_table.setItem(i, 4, QTableWidgetItem(escrow['created_at'][:10]))
-                self.escrows_table.setItem(i, 5, QTableWidgetItem(escrow['provider_wallet_id']))
-                
-                # Add action buttons
-                actions_widget = QWidget()
-                actions_layout = QHBoxLayout(actions_widget)
-                actions_layout.setContentsMargins(0, 0, 0, 0)
-                
-                if escrow['status'] == 'ACTIVE':
-                    release_btn = QPushButton("Release")
-                    release_btn.clicked.connect(lambda checked, eid=escrow['id']: self.release_escrow(eid))
-                    actions_layout.addWidget(release_btn)
-                
-                dispute_btn = QPushButton("Dispute")
-                dispute_btn.clicked.connect(lambda checked, eid=escrow['id']: self.create_dispute(eid))
-                actions_layout.addWidget(dispute_btn)
-                
-                self.escrows_table.setCellWidget(i, 6, actions_widget)
-            
-            # Refresh community fund info
-            fund_info = self.escrow_client.get_community_fund_info()
             self.fund_balance_label.setText(f"{fund_info['balance']:.8f} FLOP")
             self.airdrop_threshold_label.setText(f"{fund_info['airdrop_threshold']:.8f} FLOP")
             self.last_airdrop_label.setText(fund_info.get('last_airdrop', 'Never'))
-            
         except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to refresh escrows: {e}")
+            QMessageBox.warning(self, "Error", f"Failed to refresh community fund: {e}")
+    
+    def escrow_actions(self, escrow):
+        """Action buttons shown for an escrow row"""
+        actions = []
+        if escrow.get('status') == 'ACTIVE':
+            actions.append(("Release", self.release_escrow))
+        actions.append(("Dispute", self.create_dispute))
+        return actions
     
     def create_escrow(self):
         """Create a new escrow"""
@@ -305,7 +870,7 @@ class EscrowManagementWidget(QWidget):
             self.provider_address_input.clear()
             
             # Refresh list
-            self.refresh_escrows()
+            self.refresh_escrows(supersede=True)
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to create escrow: {e}")
@@ -315,7 +880,7 @@ class EscrowManagementWidget(QWidget):
         try:
             result = self.escrow_client.release_escrow(escrow_id)
             QMessageBox.information(self, "Success", f"Escrow {escrow_id} released successfully!")
-            self.refresh_escrows()
+            self.refresh_escrows(supersede=True)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to release escrow: {e}")
     
@@ -326,7 +891,7 @@ class EscrowManagementWidget(QWidget):
             if ok and reason:
                 dispute = self.escrow_client.create_dispute(escrow_id, reason)
                 QMessageBox.information(self, "Success", f"Dispute created for escrow {escrow_id}")
-                self.refresh_escrows()
+                self.refresh_escrows(supersede=True)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to create dispute: {e}")
 
@@ -334,14 +899,25 @@ class EscrowManagementWidget(QWidget):
 class TaskEngineWidget(QWidget):
     """Task engine management and monitoring widget"""
     
-    def __init__(self, task_client, parent=None):
+    def __init__(self, task_client, parent=None, refresh_scheduler=None):
         super().__init__(parent)
         self.task_client = task_client
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.refresh_tasks)
-        self.refresh_timer.start(5000)  # Refresh every 5 seconds
+        self.rpc = BackgroundRpc(self)
+        self.refresh_scheduler = refresh_scheduler or RefreshScheduler(self)
+        self.refresh_scheduler.register(self.refresh_tasks, 5000, self)  # Refresh every 5 seconds
         self.setup_ui()
         self.refresh_tasks()
+        
+        # Task changes pushed by the engine, when enabled; polling only
+        # reconciles while connected
+        if WEBSOCKETS_AVAILABLE and getattr(self.task_client, "push_events", False):
+            self.task_events = EventSubscription(self.task_client.events_url(), self)
+            self.task_events.record_received.connect(self.tasks_model.upsert)
+            self.task_events.connected_changed.connect(self.set_push_active)
+    
+    def set_push_active(self, active):
+        """Poll rarely while task updates are pushed"""
+        self.refresh_scheduler.set_interval(self.refresh_tasks, 60000 if active else 5000)
     
     def setup_ui(self):
         layout = QVBoxLayout(self)
@@ -358,32 +934,8 @@ class TaskEngineWidget(QWidget):
         left_widget = QWidget()
         left_layout = QVBoxLayout(left_widget)
         
-        submit_group = QGroupBox("Submit Task")
-        submit_layout = QFormLayout(submit_group)
-        
-        self.task_type_combo = QComboBox()
-        self.task_type_combo.addItems(["API_CALL", "BATCH_PROCESSING", "MACHINE_LEARNING", "DATA_ANALYSIS", "IMAGE_PROCESSING"])
-        submit_layout.addRow("Task Type:", self.task_type_combo)
-        
-        self.service_name_input = QLineEdit()
-        self.service_name_input.setPlaceholderText("Enter service name")
-        submit_layout.addRow("Service Name:", self.service_name_input)
-        
-        self.task_code_input = QTextEdit()
-        self.task_code_input.setMaximumHeight(100)
-        self.task_code_input.setPlaceholderText("Enter task code or API endpoint")
-        submit_layout.addRow("Task Code:", self.task_code_input)
-        
-        self.payment_amount_input = QDoubleSpinBox()
-        self.payment_amount_input.setRange(0.1, 1000.0)
-        self.payment_amount_input.setDecimals(8)
-        submit_layout.addRow("Payment Amount:", self.payment_amount_input)
-        
-        self.submit_task_button = QPushButton("Submit Task")
-        self.submit_task_button.clicked.connect(self.submit_task)
-        submit_layout.addRow("", self.submit_task_button)
-        
-        left_layout.addWidget(submit_group)
+        # Task submission, built when first expanded
+        left_layout.addWidget(LazyGroupBox("Submit Task", self.build_submit_form))
         
         # Statistics
         stats_group = QGroupBox("Statistics")
@@ -412,12 +964,26 @@ class TaskEngineWidget(QWidget):
         tasks_group = QGroupBox("Task Monitoring")
         tasks_layout = QVBoxLayout(tasks_group)
         
-        self.tasks_table = QTableWidget()
-        self.tasks_table.setColumnCount(7)
-        self.tasks_table.setHorizontalHeaderLabels([
-            "ID", "Type", "Service", "Status", "Progress", "Payment", "Actions"
-        ])
-        self.tasks_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.tasks_model = RecordTableModel(
+            [
+                ("ID", lambda t: t.get('task_id', '')[:8]),
+                ("Type", lambda t: t.get('task_type', '')),
+                ("Service", lambda t: t.get('service_name', '')),
+                ("Status", lambda t: t.get('status', '')),
+                ("Progress", self.task_progress),
+                ("Payment", lambda t: format_amount(t.get('payment_amount', 0))),
+                ("Actions", None),
+            ],
+            key_field='task_id',
+            parent=self,
+        )
+        self.tasks_table = make_record_table(self.tasks_model)
+        self.tasks_table.setItemDelegateForColumn(
+            4, ProgressBarDelegate(self.tasks_table)
+        )
+        self.tasks_table.setItemDelegateForColumn(
+            6, ActionButtonDelegate(self.task_actions, self.tasks_table)
+        )
         tasks_layout.addWidget(self.tasks_table)
         
         right_layout.addWidget(tasks_group)
@@ -426,56 +992,82 @@ class TaskEngineWidget(QWidget):
         
         layout.addWidget(splitter)
     
-    def refresh_tasks(self):
+    def build_submit_form(self, container):
+        """Build the submit task form"""
+        submit_layout = QFormLayout(container)
+        
+        self.task_type_combo = QComboBox()
+        self.task_type_combo.addItems(TASK_TYPES)
+        submit_layout.addRow("Task Type:", self.task_type_combo)
+        
+        self.service_name_input = QLineEdit()
+        self.service_name_input.setPlaceholderText("Enter service name")
+        submit_layout.addRow("Service Name:", self.service_name_input)
+        
+        self.task_code_input = QTextEdit()
+        self.task_code_input.setMaximumHeight(100)
+        self.task_code_input.setPlaceholderText("Enter task code or API endpoint")
+        submit_layout.addRow("Task Code:", self.task_code_input)
+        
+        self.payment_amount_input = QDoubleSpinBox()
+        self.payment_amount_input.setRange(0.1, 1000.0)
+        self.payment_amount_input.setDecimals(8)
+        submit_layout.addRow("Payment Amount:", self.payment_amount_input)
+        
+        self.submit_task_button = QPushButton("Submit Task")
+        self.submit_task_button.clicked.connect(self.submit_task)
+        submit_layout.addRow("", self.submit_task_button)
+    
+    def refresh_tasks(self, supersede=False):
         """Refresh task list and statistics"""
+        # Independent requests, so they run on separate workers at the same time
+        self.rpc.call(
+            "tasks",
+            self.task_client.get_tasks,
+            self.apply_tasks,
+            lambda error: QMessageBox.warning(self, "Error", f"Failed to refresh tasks: {error}"),
+            supersede=supersede,
+        )
+        self.rpc.call(
+            "task_stats",
+            self.task_client.get_statistics,
+            self.apply_task_stats,
+            lambda error: QMessageBox.warning(self, "Error", f"Failed to refresh task statistics: {error}"),
+            supersede=supersede,
+        )
+    
+    def apply_tasks(self, tasks):
+        """Show fetched tasks"""
+        try:
+            update_record_table(self.tasks_table, tasks)
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Failed to refresh tasks: {e}")
+    
+    def apply_task_stats(self, stats):
+        """Show fetched task statistics"""
         try:
-            # Get tasks
-            tasks = self.task_client.get_tasks()
-            
-            self.tasks_table.setRowCount(len(tasks))
-            for i, task in enumerate(tasks):
-                self.tasks_table.setItem(i, 0, QTableWidgetItem(task['task_id'][:8]))
-                self.tasks_table.setItem(i, 1, QTableWidgetItem(task['task_type']))
-                self.tasks_table.setItem(i, 2, QTableWidgetItem(task['service_name']))
-                self.tasks_table.setItem(i, 3, QTableWidgetItem(task['status']))
-                
-                # Progress bar
-                progress = QProgressBar()
-                if task['status'] == 'COMPLETED':
-                    progress.setValue(100)
-                elif task['status'] == 'RUNNING':
-                    progress.setValue(50)
-                else:
-                    progress.setValue(0)
-                self.tasks_table.setCellWidget(i, 4, progress)
-                
-                self.tasks_table.setItem(i, 5, QTableWidgetItem(f"{task['payment_amount']:.8f}"))
-                
-                # Actions
-                actions_widget = QWidget()
-                actions_layout = QHBoxLayout(actions_widget)
-                actions_layout.setContentsMargins(0, 0, 0, 0)
-                
-                if task['status'] == 'PENDING':
-                    cancel_btn = QPushButton("Cancel")
-                    cancel_btn.clicked.connect(lambda checked, tid=task['task_id']: self.cancel_task(tid))
-                    actions_layout.addWidget(cancel_btn)
-                
-                view_btn = QPushButton("View")
-                view_btn.clicked.connect(lambda checked, tid=task['task_id']: self.view_task(tid))
-                actions_layout.addWidget(view_btn)
-                
-                self.tasks_table.setCellWidget(i, 6, actions_widget)
-            
-            # Update statistics
-            stats = self.task_client.get_statistics()
             self.total_tasks_label.setText(str(stats['total_tasks']))
             self.active_tasks_label.setText(str(stats['active_tasks']))
             self.completed_tasks_label.setText(str(stats['completed_tasks']))
             self.success_rate_label.setText(f"{stats['success_rate']:.1f}%")
-            
         except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to refresh tasks: {e}")
+            QMessageBox.warning(self, "Error", f"Failed to refresh task statistics: {e}")
+    
+    def task_progress(self, task):
+        """Progress shown for a task row"""
+        if task.get('status') == 'COMPLETED':
+            return 100
+        elif task.get('status') == 'RUNNING':
+            return 50
+        return 0
+    
+    def task_actions(self, task):
+        """Action buttons shown for a task row"""
+        actions = []
+        if task.get('status') == 'PENDING':
+            actions.append(("Cancel", self.cancel_task))
+        actions.append(("View", self.view_task))
+        return actions
     
     def submit_task(self):
         """Submit a new task"""
@@ -504,7 +1096,7 @@ class TaskEngineWidget(QWidget):
             self.payment_amount_input.setValue(0.1)
             
             # Refresh list
-            self.refresh_tasks()
+            self.refresh_tasks(supersede=True)
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to submit task: {e}")
@@ -514,7 +1106,7 @@ class TaskEngineWidget(QWidget):
         try:
             result = self.task_client.cancel_task(task_id)
             QMessageBox.information(self, "Success", f"Task {task_id} cancelled")
-            self.refresh_tasks()
+            self.refresh_tasks(supersede=True)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to cancel task: {e}")
     
@@ -531,7 +1123,7 @@ class TaskEngineWidget(QWidget):
             
             # Task details
             details_text = QTextEdit()
-            details_text.setPlainText(json.dumps(task, indent=2))
+            details_text.setPlainText(pretty_json(task))
             details_text.setReadOnly(True)
             layout.addWidget(details_text)
             
@@ -541,15 +1133,22 @@ class TaskEngineWidget(QWidget):
             QMessageBox.critical(self, "Error", f"Failed to view task: {e}")
 
 
+DAEMON_STATUS_COLORS = {
+    'running': Qt.green,
+    'stopped': Qt.red,
+    'syncing': Qt.yellow,
+}
+
+
 class DaemonManagerWidget(QWidget):
     """Daemon management and monitoring widget"""
     
-    def __init__(self, daemon_client, parent=None):
+    def __init__(self, daemon_client, parent=None, refresh_scheduler=None):
         super().__init__(parent)
         self.daemon_client = daemon_client
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.refresh_daemons)
-        self.refresh_timer.start(15000)  # Refresh every 15 seconds
+        self.rpc = BackgroundRpc(self)
+        self.refresh_scheduler = refresh_scheduler or RefreshScheduler(self)
+        self.refresh_scheduler.register(self.refresh_daemons, 15000, self)  # Refresh every 15 seconds
         self.setup_ui()
         self.refresh_daemons()
     
@@ -566,7 +1165,7 @@ class DaemonManagerWidget(QWidget):
         controls_layout = QHBoxLayout(controls_group)
         
         self.daemon_combo = QComboBox()
-        self.daemon_combo.addItems(["bitcoind", "ethereumd", "flopcoind", "litecoind", "dogecoind"])
+        self.daemon_combo.addItems(DAEMONS)
         controls_layout.addWidget(QLabel("Daemon:"))
         controls_layout.addWidget(self.daemon_combo)
         
@@ -588,19 +1187,36 @@ class DaemonManagerWidget(QWidget):
         status_group = QGroupBox("Daemon Status")
         status_layout = QVBoxLayout(status_group)
         
-        self.daemons_table = QTableWidget()
-        self.daemons_table.setColumnCount(6)
-        self.daemons_table.setHorizontalHeaderLabels([
-            "Daemon", "Status", "Uptime", "Sync Progress", "Connections", "Actions"
-        ])
-        self.daemons_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.daemons_model = RecordTableModel(
+            [
+                ("Daemon", lambda d: d.get('name', '')),
+                ("Status", lambda d: d.get('status', '')),
+                ("Uptime", lambda d: d.get('uptime', 'N/A')),
+                ("Sync Progress", lambda d: d.get('sync_progress', 0)),
+                ("Connections", lambda d: str(d.get('connections', 0))),
+                ("Actions", None),
+            ],
+            key_field='name',
+            background=self.daemon_background,
+            parent=self,
+        )
+        self.daemons_table = make_record_table(self.daemons_model)
+        self.daemons_table.setItemDelegateForColumn(
+            3, ProgressBarDelegate(self.daemons_table)
+        )
+        self.daemons_table.setItemDelegateForColumn(
+            5, ActionButtonDelegate(self.daemon_actions, self.daemons_table)
+        )
         status_layout.addWidget(self.daemons_table)
         
         layout.addWidget(status_group)
         
-        # Configuration
-        config_group = QGroupBox("Configuration")
-        config_layout = QFormLayout(config_group)
+        # Configuration, built when first expanded
+        layout.addWidget(LazyGroupBox("Configuration", self.build_config_form))
+    
+    def build_config_form(self, container):
+        """Build the daemon configuration form"""
+        config_layout = QFormLayout(container)
         
         self.config_path_input = QLineEdit()
         self.config_path_input.setPlaceholderText("Path to daemon configuration")
@@ -618,60 +1234,40 @@ class DaemonManagerWidget(QWidget):
         self.save_config_button = QPushButton("Save Configuration")
         self.save_config_button.clicked.connect(self.save_config)
         config_layout.addRow("", self.save_config_button)
-        
-        layout.addWidget(config_group)
     
-    def refresh_daemons(self):
+    def refresh_daemons(self, supersede=False):
         """Refresh daemon status"""
+        self.rpc.call(
+            "daemons",
+            self.daemon_client.get_daemon_status,
+            self.apply_daemons,
+            lambda error: QMessageBox.warning(self, "Error", f"Failed to refresh daemons: {error}"),
+            supersede=supersede,
+        )
+    
+    def apply_daemons(self, daemons):
+        """Show fetched daemon status"""
         try:
-            daemons = self.daemon_client.get_daemon_status()
-            
-            self.daemons_table.setRowCount(len(daemons))
-            for i, daemon in enumerate(daemons):
-                self.daemons_table.setItem(i, 0, QTableWidgetItem(daemon['name']))
-                
-                # Status with color
-                status_item = QTableWidgetItem(daemon['status'])
-                if daemon['status'] == 'running':
-                    status_item.setBackground(Qt.green)
-                elif daemon['status'] == 'stopped':
-                    status_item.setBackground(Qt.red)
-                elif daemon['status'] == 'syncing':
-                    status_item.setBackground(Qt.yellow)
-                self.daemons_table.setItem(i, 1, status_item)
-                
-                self.daemons_table.setItem(i, 2, QTableWidgetItem(daemon.get('uptime', 'N/A')))
-                
-                # Sync progress bar
-                sync_progress = QProgressBar()
-                sync_progress.setValue(daemon.get('sync_progress', 0))
-                self.daemons_table.setCellWidget(i, 3, sync_progress)
-                
-                self.daemons_table.setItem(i, 4, QTableWidgetItem(str(daemon.get('connections', 0))))
-                
-                # Actions
-                actions_widget = QWidget()
-                actions_layout = QHBoxLayout(actions_widget)
-                actions_layout.setContentsMargins(0, 0, 0, 0)
-                
-                if daemon['status'] == 'running':
-                    stop_btn = QPushButton("Stop")
-                    stop_btn.clicked.connect(lambda checked, name=daemon['name']: self.stop_daemon(name))
-                    actions_layout.addWidget(stop_btn)
-                else:
-                    start_btn = QPushButton("Start")
-                    start_btn.clicked.connect(lambda checked, name=daemon['name']: self.start_daemon(name))
-                    actions_layout.addWidget(start_btn)
-                
-                restart_btn = QPushButton("Restart")
-                restart_btn.clicked.connect(lambda checked, name=daemon['name']: self.restart_daemon(name))
-                actions_layout.addWidget(restart_btn)
-                
-                self.daemons_table.setCellWidget(i, 5, actions_widget)
-            
+            update_record_table(self.daemons_table, daemons)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to refresh daemons: {e}")
     
+    def daemon_background(self, daemon, column):
+        """Status cell color for a daemon row"""
+        if column != 1:
+            return None
+        color = DAEMON_STATUS_COLORS.get(daemon.get('status'))
+        return QColor(color) if color is not None else None
+    
+    def daemon_actions(self, daemon):
+        """Action buttons shown for a daemon row"""
+        if daemon.get('status') == 'running':
+            actions = [("Stop", self.stop_daemon)]
+        else:
+            actions = [("Start", self.start_daemon)]
+        actions.append(("Restart", self.restart_daemon))
+        return actions
+    
     def start_daemon(self, daemon_name=None):
         """Start a daemon"""
         try:
@@ -680,7 +1276,7 @@ class DaemonManagerWidget(QWidget):
             
             result = self.daemon_client.start_daemon(daemon_name)
             QMessageBox.information(self, "Success", f"Started {daemon_name}")
-            self.refresh_daemons()
+            self.refresh_daemons(supersede=True)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to start {daemon_name}: {e}")
     
@@ -692,7 +1288,7 @@ class DaemonManagerWidget(QWidget):
             
             result = self.daemon_client.stop_daemon(daemon_name)
             QMessageBox.information(self, "Success", f"Stopped {daemon_name}")
-            self.refresh_daemons()
+            self.refresh_daemons(supersede=True)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to stop {daemon_name}: {e}")
     
@@ -704,7 +1300,7 @@ class DaemonManagerWidget(QWidget):
             
             result = self.daemon_client.restart_daemon(daemon_name)
             QMessageBox.information(self, "Success", f"Restarted {daemon_name}")
-            self.refresh_daemons()
+            self.refresh_daemons(supersede=True)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to restart {daemon_name}: {e}")
     
@@ -726,15 +1322,19 @@ class DaemonManagerWidget(QWidget):
 class AdvancedFeaturesTab(QWidget):
     """Main advanced features tab widget"""
     
-    def __init__(self, api_client, wallet_client, parent=None):
+    def __init__(self, api_client, wallet_client, parent=None,
+                 escrow_client=None, task_client=None, daemon_client=None):
         super().__init__(parent)
         self.api_client = api_client
         self.wallet_client = wallet_client
         
-        # Initialize clients for advanced features
-        self.escrow_client = EscrowClient()
-        self.task_client = TaskClient()
-        self.daemon_client = DaemonClient()
+        # Initialize clients for advanced features, reusing any the window already holds
+        self.escrow_client = escrow_client or EscrowClient()
+        self.task_client = task_client or TaskClient()
+        self.daemon_client = daemon_client or DaemonClient()
+        
+        # One timer drives the refreshes of all feature tabs
+        self.refresh_scheduler = RefreshScheduler(self)
         
         self.setup_ui()
     
@@ -745,19 +1345,19 @@ class AdvancedFeaturesTab(QWidget):
         self.tab_widget = QTabWidget()
         
         # Multi-crypto wallet tab
-        self.wallet_tab = MultiCryptoWalletWidget(self.wallet_client)
+        self.wallet_tab = MultiCryptoWalletWidget(self.wallet_client, refresh_scheduler=self.refresh_scheduler)
         self.tab_widget.addTab(self.wallet_tab, "Multi-Crypto Wallet")
         
         # Escrow management tab
-        self.escrow_tab = EscrowManagementWidget(self.escrow_client)
+        self.escrow_tab = EscrowManagementWidget(self.escrow_client, refresh_scheduler=self.refresh_scheduler)
         self.tab_widget.addTab(self.escrow_tab, "Escrow Management")
         
         # Task engine tab
-        self.task_tab = TaskEngineWidget(self.task_client)
+        self.task_tab = TaskEngineWidget(self.task_client, refresh_scheduler=self.refresh_scheduler)
         self.tab_widget.addTab(self.task_tab, "Task Engine")
         
         # Daemon manager tab
-        self.daemon_tab = DaemonManagerWidget(self.daemon_client)
+        self.daemon_tab = DaemonManagerWidget(self.daemon_client, refresh_scheduler=self.refresh_scheduler)
         self.tab_widget.addTab(self.daemon_tab, "Daemon Manager")
         
         layout.addWidget(self.tab_widget)
@@ -767,14 +1367,16 @@ class AdvancedFeaturesTab(QWidget):
 class EscrowClient:
     """Client for escrow service API"""
     
-    def __init__(self, base_url="http://localhost:8004"):
-        self.base_url = base_url
+    def __init__(self, base_url="http://localhost:8004", session=None, push_events=False):
+        self.base_url = base_url.rstrip("/")
+        self.session = session or SESSION
+        self.push_events = push_events  # only for services that serve events_url()
     
+    @memoize(stale_ms=1000, ttl_ms=5000)
     def get_active_escrows(self):
         """Get active escrows"""
-        response = requests.get(f"{self.base_url}/escrows")
-        response.raise_for_status()
-        return response.json()
+        response = self.session.get(f"{self.base_url}/escrows")
+        return response_json(response)
     
     def create_escrow(self, service_name, amount, provider_address):
         """Create a new escrow"""
@@ -783,41 +1385,52 @@ class EscrowClient:
             "amount": amount,
             "provider_address": provider_address
         }
-        response = requests.post(f"{self.base_url}/escrows", json=data)
-        response.raise_for_status()
-        return response.json()
+        response = self.session.post(f"{self.base_url}/escrows", json=data)
+        self.get_active_escrows.cache_clear()
+        return response_json(response)
     
     def release_escrow(self, escrow_id):
         """Release an escrow"""
-        response = requests.post(f"{self.base_url}/escrows/{escrow_id}/release")
-        response.raise_for_status()
-        return response.json()
+        response = self.session.post(f"{self.base_url}/escrows/{escrow_id}/release")
+        self.get_active_escrows.cache_clear()
+        self.get_community_fund_info.cache_clear()
+        return response_json(response)
     
     def create_dispute(self, escrow_id, reason):
         """Create a dispute"""
         data = {"reason": reason}
-        response = requests.post(f"{self.base_url}/escrows/{escrow_id}/disputes", json=data)
-        response.raise_for_status()
-        return response.json()
+        response = self.session.post(f"{self.base_url}/escrows/{escrow_id}/disputes", json=data)
+        self.get_active_escrows.cache_clear()
+        return response_json(response)
     
+    def events_url(self):
+        """WebSocket URL on which escrow changes are pushed"""
+        return self.base_url.replace("http", "ws", 1) + "/escrows/events"
+    
+    @memoize(stale_ms=5000, ttl_ms=60000)
     def get_community_fund_info(self):
         """Get community fund information"""
-        response = requests.get(f"{self.base_url}/community-fund")
-        response.raise_for_status()
-        return response.json()
+        response = self.session.get(f"{self.base_url}/community-fund")
+        return response_json(response)
 
 
 class TaskClient:
     """Client for task engine API"""
     
-    def __init__(self, base_url="http://localhost:8001"):
-        self.base_url = base_url
+    def __init__(self, base_url="http://localhost:8001", session=None, push_events=False):
+        self.base_url = base_url.rstrip("/")
+        self.session = session or SESSION
+        self.push_events = push_events  # only for engines that serve events_url()
+    
+    def events_url(self):
+        """WebSocket URL on which task changes are pushed"""
+        return self.base_url.replace("http", "ws", 1) + "/tasks/events"
     
+    @memoize(stale_ms=1000, ttl_ms=5000)
     def get_tasks(self):
         """Get all tasks"""
-        response = requests.get(f"{self.base_url}/tasks")
-        response.raise_for_status()
-        return response.json()
+        response = self.session.get(f"{self.base_url}/tasks")
+        return response_json(response)
     
     def submit_task(self, task_type, service_name, code, payment_amount):
         """Submit a new task"""
@@ -827,61 +1440,62 @@ class TaskClient:
             "code": code,
             "payment_amount": payment_amount
         }
-        response = requests.post(f"{self.base_url}/tasks", json=data)
-        response.raise_for_status()
-        return response.json()
+        response = self.session.post(f"{self.base_url}/tasks", json=data)
+        self.get_tasks.cache_clear()
+        self.get_statistics.cache_clear()
+        return response_json(response)
     
     def cancel_task(self, task_id):
         """Cancel a task"""
-        response = requests.post(f"{self.base_url}/tasks/{task_id}/cancel")
-        response.raise_for_status()
-        return response.json()
+        response = self.session.post(f"{self.base_url}/tasks/{task_id}/cancel")
+        self.get_tasks.cache_clear()
+        self.get_statistics.cache_clear()
+        return response_json(response)
     
     def get_task(self, task_id):
         """Get task details"""
-        response = requests.get(f"{self.base_url}/tasks/{task_id}")
-        response.raise_for_status()
-        return response.json()
+        response = self.session.get(f"{self.base_url}/tasks/{task_id}")
+        return response_json(response)
     
+    @memoize(stale_ms=5000, ttl_ms=60000)
     def get_statistics(self):
         """Get task engine statistics"""
-        response = requests.get(f"{self.base_url}/statistics")
-        response.raise_for_status()
-        return response.json()
+        response = self.session.get(f"{self.base_url}/statistics")
+        return response_json(response)
 
 
 class DaemonClient:
     """Client for daemon manager API"""
     
-    def __init__(self, base_url="http://localhost:8003"):
-        self.base_url = base_url
+    def __init__(self, base_url="http://localhost:8003", session=None):
+        self.base_url = base_url.rstrip("/")
+        self.session = session or SESSION
     
+    @memoize(stale_ms=5000, ttl_ms=60000)
     def get_daemon_status(self):
         """Get status of all daemons"""
-        response = requests.get(f"{self.base_url}/daemons/status")
-        response.raise_for_status()
-        return response.json()
+        response = self.session.get(f"{self.base_url}/daemons/status")
+        return response_json(response)
     
     def start_daemon(self, daemon_name):
         """Start a daemon"""
-        response = requests.post(f"{self.base_url}/daemons/{daemon_name}/start")
-        response.raise_for_status()
-        return response.json()
+        response = self.session.post(f"{self.base_url}/daemons/{daemon_name}/start")
+        self.get_daemon_status.cache_clear()
+        return response_json(response)
     
     def stop_daemon(self, daemon_name):
         """Stop a daemon"""
-        response = requests.post(f"{self.base_url}/daemons/{daemon_name}/stop")
-        response.raise_for_status()
-        return response.json()
+        response = self.session.post(f"{self.base_url}/daemons/{daemon_name}/stop")
+        self.get_daemon_status.cache_clear()
+        return response_json(response)
     
     def restart_daemon(self, daemon_name):
         """Restart a daemon"""
-        response = requests.post(f"{self.base_url}/daemons/{daemon_name}/restart")
-        response.raise_for_status()
-        return response.json()
+        response = self.session.post(f"{self.base_url}/daemons/{daemon_name}/restart")
+        self.get_daemon_status.cache_clear()
+        return response_json(response)
     
     def save_config(self, config):
         """Save daemon configuration"""
-        response = requests.post(f"{self.base_url}/daemons/config", json=config)
-        response.raise_for_status()
-        return response.json() 
\ No newline at end of file
+        response = self.session.post(f"{self.base_url}/daemons/config", json=config)
+        return response_json(response) 
\ No newline at end of file
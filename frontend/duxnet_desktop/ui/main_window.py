@@ -4,7 +4,7 @@ Main Window UI for DuxOS Desktop
 Provides navigation, search, and service list.
 """
 
-from PyQt5.QtCore import QObject, Qt, Qt as QtCoreQt
+from PyQt5.QtCore import QObject, QSortFilterProxyModel, Qt, Qt as QtCoreQt
 from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import (
     QAction,
@@ -13,8 +13,8 @@ from PyQt5.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QListView,
     QListWidget,
-    QListWidgetItem,
     QMainWindow,
     QMenu,
     QMenuBar,
@@ -26,26 +26,61 @@ from PyQt5.QtWidgets import (
     QTabWidget,
     QStyleFactory,
     QApplication,
-    QTableWidget,
+    QTableView,
     QComboBox,
     QGroupBox,
-    QTableWidgetItem,
     QTextEdit,
 )
 
 from .service_detail import ServiceDetailView
 from .settings import SettingsWidget
 from .user_account import UserAccountWidget
-from .advanced_features import AdvancedFeaturesTab
+from .advanced_features import AdvancedFeaturesTab, BackgroundRpc, RecordTableModel, RefreshScheduler
 from frontend.duxnet_desktop.ui.advanced_features import EscrowClient
 from frontend.duxnet_desktop.ui.advanced_features import TaskClient
-import json
+from frontend.duxnet_desktop.http_session import pretty_json
+
+TASK_STATUS_COLORS = {
+    "COMPLETED": QColor("green"),
+    "FAILED": QColor("red"),
+    "RUNNING": QColor("blue"),
+}
+DEFAULT_TASK_STATUS_COLOR = QColor("darkGray")
+
+
+def task_status_color(task, column):
+    """Status column text color for a task row"""
+    if column == 2:
+        return TASK_STATUS_COLORS.get(task["status"], DEFAULT_TASK_STATUS_COLOR)
+    return None
+
+
+def balance_tooltip(balance, column):
+    """Powered-by column tooltip for a balance row"""
+    if column == 2 and balance["powered_by"] == "wallet-core":
+        return "Powered by Trust Wallet wallet-core"
+    return None
+
+
+def make_table(model, sortable=False, parent=None):
+    """Create a QTableView over the model, sorted through a proxy if sortable"""
+    view = QTableView(parent)
+    if sortable:
+        proxy = QSortFilterProxyModel(parent)
+        proxy.setSourceModel(model)
+        view.setModel(proxy)
+        view.setSortingEnabled(True)
+    else:
+        view.setModel(model)
+    view.horizontalHeader().setStretchLastSection(True)
+    return view
 
 # --- New tab widgets ---
 class StoreTab(QWidget):
     def __init__(self, api_client, parent=None):
         super().__init__(parent)
         self.api_client = api_client
+        self.rpc = BackgroundRpc(self)
         layout = QVBoxLayout(self)
 
         # --- Search Bar ---
@@ -95,8 +130,13 @@ class StoreTab(QWidget):
 
         # --- Service List and Details ---
         main_splitter = QSplitter(Qt.Horizontal)
-        self.service_list = QListWidget()
-        self.service_list.itemClicked.connect(self.show_service_details)
+        self.services_model = RecordTableModel(
+            [("Service", lambda svc: f"{svc.get('name', '')} ({svc.get('category', '')})")],
+            "service_id",
+        )
+        self.service_list = QListView()
+        self.service_list.setModel(self.services_model)
+        self.service_list.clicked.connect(self.show_service_details)
         main_splitter.addWidget(self.service_list)
         self.details_panel = QTextEdit()
         self.details_panel.setReadOnly(True)
@@ -132,57 +172,73 @@ class StoreTab(QWidget):
             "github_link": github_link,
             "usage": usage_text,
         }
-        try:
-            result = self.api_client.register_service(service_data, owner_id, owner_name)
-            self.status_label.setText(f"Service registered: {result.get('name', 'Success')}")
-            self.load_services()
-        except Exception as e:
-            self.status_label.setText(f"Registration failed: {e}")
+        self.rpc.call(
+            "register",
+            lambda: self.api_client.register_service(service_data, owner_id, owner_name),
+            self.service_registered,
+            lambda error: self.status_label.setText(f"Registration failed: {error}"),
+        )
+
+    def service_registered(self, result):
+        self.status_label.setText(f"Service registered: {result.get('name', 'Success')}")
+        self.load_services()
 
     def load_services(self):
-        self.service_list.clear()
         self.status_label.setText("Loading services...")
-        try:
-            result = self.api_client.search_services()
-            for svc in result.get("services", []):
-                item = QListWidgetItem(f"{svc['name']} ({svc['category']})")
-                item.setData(Qt.UserRole, svc)
-                self.service_list.addItem(item)
-            self.status_label.clear()
-        except Exception as e:
-            self.status_label.setText(f"Error loading services: {e}")
+        # A newer listing or search replaces one still in flight
+        self.rpc.call(
+            "services",
+            self.api_client.search_services,
+            self.show_services,
+            lambda error: self.status_label.setText(f"Error loading services: {error}"),
+            supersede=True,
+        )
 
     def perform_search(self):
         query = self.search_input.text().strip()
-        self.service_list.clear()
         self.status_label.setText("Searching...")
-        try:
-            result = self.api_client.search_services(query=query)
-            for svc in result.get("services", []):
-                item = QListWidgetItem(f"{svc['name']} ({svc['category']})")
-                item.setData(Qt.UserRole, svc)
-                self.service_list.addItem(item)
-            self.status_label.clear()
-        except Exception as e:
-            self.status_label.setText(f"Error searching: {e}")
+        self.rpc.call(
+            "services",
+            lambda: self.api_client.search_services(query=query),
+            self.show_services,
+            lambda error: self.status_label.setText(f"Error searching: {error}"),
+            supersede=True,
+        )
+
+    def show_services(self, result):
+        self.services_model.update(
+            dict(svc, service_id=str(svc.get("service_id", "")))
+            for svc in result.get("services", [])
+        )
+        self.status_label.clear()
 
-    def show_service_details(self, item):
-        svc = item.data(Qt.UserRole)
-        self.details_panel.setText(json.dumps(svc, indent=2))
+    def show_service_details(self, index):
+        svc = self.services_model.record(index.row())
+        self.details_panel.setText(pretty_json(svc))
 
 class WalletTab(QWidget):
-    def __init__(self, wallet_client, parent=None):
+    def __init__(self, wallet_client, parent=None, escrow_client=None):
         super().__init__(parent)
         self.wallet_client = wallet_client
-        self.escrow_client = EscrowClient()  # Uses default base_url
+        self.escrow_client = escrow_client or EscrowClient()  # Uses default base_url
+        self.rpc = BackgroundRpc(self)
         layout = QVBoxLayout(self)
 
         # --- Balances Section ---
         balances_group = QGroupBox("Multi-Crypto Balances")
         balances_layout = QVBoxLayout(balances_group)
-        self.balances_table = QTableWidget(0, 3)
-        self.balances_table.setHorizontalHeaderLabels(["Currency", "Balance", "Powered by"])
-        self.balances_table.horizontalHeader().setStretchLastSection(True)
+        self.balances_model = RecordTableModel(
+            [
+                ("Currency", lambda b: b["currency"]),
+                ("Balance", lambda b: str(b.get("balance", 0.0))),
+                # Trust Wallet badge/tooltip
+                ("Powered by", lambda b: "Trust Wallet" if b["powered_by"] == "wallet-core" else "-"),
+            ],
+            key_field="currency",
+            parent=self,
+            tooltip=balance_tooltip,
+        )
+        self.balances_table = make_table(self.balances_model, parent=self)
         balances_layout.addWidget(self.balances_table)
         layout.addWidget(balances_group)
 
@@ -230,34 +286,35 @@ class WalletTab(QWidget):
         self.load_escrows()
 
     def load_balances(self):
-        self.balances_table.setRowCount(0)
+        self.rpc.call(
+            "balances",
+            lambda: self.wallet_client.get_all_balances(),
+            self.show_balances,
+            lambda error: self.status_label.setText(f"Error loading balances: {error}"),
+            supersede=True,
+        )
+
+    def show_balances(self, balances):
         try:
-            balances = self.wallet_client.get_all_balances()
-            self.balances_table.setRowCount(len(balances))
-            for i, (currency, info) in enumerate(balances.items()):
-                currency_item = QTableWidgetItem(currency)
-                currency_item.setFlags(currency_item.flags() & ~Qt.ItemIsEditable)
-                self.balances_table.setItem(i, 0, currency_item)
-                balance_item = QTableWidgetItem(str(info.get("balance", 0.0)))
-                balance_item.setFlags(balance_item.flags() & ~Qt.ItemIsEditable)
-                self.balances_table.setItem(i, 1, balance_item)
-                # Trust Wallet badge/tooltip
-                powered_by = info.get("powered_by", "")
-                badge = QTableWidgetItem()
-                if powered_by == "wallet-core":
-                    badge.setText("Trust Wallet")
-                    badge.setToolTip("Powered by Trust Wallet wallet-core")
-                else:
-                    badge.setText("-")
-                badge.setFlags(badge.flags() & ~Qt.ItemIsEditable)
-                self.balances_table.setItem(i, 2, badge)
+            self.balances_model.update(
+                dict(info, currency=currency, powered_by=info.get("powered_by", ""))
+                for currency, info in balances.items()
+            )
         except Exception as e:
             self.status_label.setText(f"Error loading balances: {e}")
 
     def load_escrows(self):
+        self.rpc.call(
+            "escrows",
+            self.escrow_client.get_active_escrows,
+            self.show_escrows,
+            lambda error: self.status_label.setText(f"Error loading escrows: {error}"),
+            supersede=True,
+        )
+
+    def show_escrows(self, escrows):
         self.escrow_list.clear()
         try:
-            escrows = self.escrow_client.get_active_escrows()
             for esc in escrows:
                 self.escrow_list.addItem(f"{esc['id']} | {esc['currency']} {esc['amount']} | {esc['status']}")
         except Exception as e:
@@ -271,35 +328,47 @@ class WalletTab(QWidget):
         except Exception:
             self.status_label.setText("Invalid amount.")
             return
-        try:
-            result = self.wallet_client.send_transaction(currency, address, amount)
-            txid = result.get("txid", "unknown")
-            self.status_label.setText(f"Sent {amount} {currency} to {address}. TXID: {txid}")
-            self.load_balances()
-        except Exception as e:
-            self.status_label.setText(f"Send failed: {e}")
+        # A send still in flight swallows repeated clicks instead of paying twice
+        self.rpc.call(
+            "send",
+            lambda: self.wallet_client.send_transaction(currency, address, amount),
+            lambda result: self.transaction_sent(currency, address, amount, result),
+            lambda error: self.status_label.setText(f"Send failed: {error}"),
+        )
+
+    def transaction_sent(self, currency, address, amount, result):
+        txid = result.get("txid", "unknown")
+        self.status_label.setText(f"Sent {amount} {currency} to {address}. TXID: {txid}")
+        self.load_balances()
 
     def handle_receive(self):
         currency = self.currency_combo.currentText()
-        try:
-            balances = self.wallet_client.get_all_balances()
-            address = balances.get(currency, {}).get("address", "N/A")
-            self.status_label.setText(f"Receive {currency} at address: {address}")
-        except Exception as e:
-            self.status_label.setText(f"Error getting receive address: {e}")
+        self.rpc.call(
+            "receive",
+            lambda: self.wallet_client.get_all_balances(),
+            lambda balances: self.status_label.setText(
+                f"Receive {currency} at address: {balances.get(currency, {}).get('address', 'N/A')}"
+            ),
+            lambda error: self.status_label.setText(f"Error getting receive address: {error}"),
+            supersede=True,
+        )
 
     def handle_create_escrow(self):
         # For demo, use dialog or hardcoded values
-        try:
-            # TODO: Replace with real dialog for user input
-            service_name = "demo_service"
-            amount = 1.0
-            provider_address = "provider123"
-            result = self.escrow_client.create_escrow(service_name, amount, provider_address)
-            self.status_label.setText(f"Escrow created: {result}")
-            self.load_escrows()
-        except Exception as e:
-            self.status_label.setText(f"Create escrow failed: {e}")
+        # TODO: Replace with real dialog for user input
+        service_name = "demo_service"
+        amount = 1.0
+        provider_address = "provider123"
+        self.rpc.call(
+            "create_escrow",
+            lambda: self.escrow_client.create_escrow(service_name, amount, provider_address),
+            lambda result: self.escrow_changed(f"Escrow created: {result}"),
+            lambda error: self.status_label.setText(f"Create escrow failed: {error}"),
+        )
+
+    def escrow_changed(self, message):
+        self.status_label.setText(message)
+        self.load_escrows()
 
     def handle_release_escrow(self):
         selected = self.escrow_list.currentItem()
@@ -307,18 +376,21 @@ class WalletTab(QWidget):
             self.status_label.setText("Select an escrow to release.")
             return
         escrow_id = selected.text().split("|")[0].strip()
-        try:
-            result = self.escrow_client.release_escrow(escrow_id)
-            self.status_label.setText(f"Escrow released: {result}")
-            self.load_escrows()
-        except Exception as e:
-            self.status_label.setText(f"Release escrow failed: {e}")
+        self.rpc.call(
+            f"release_escrow:{escrow_id}",
+            lambda: self.escrow_client.release_escrow(escrow_id),
+            lambda result: self.escrow_changed(f"Escrow released: {result}"),
+            lambda error: self.status_label.setText(f"Release escrow failed: {error}"),
+        )
 
 class TaskEngineTab(QWidget):
-    def __init__(self, api_client, parent=None):
+    def __init__(self, api_client, parent=None, task_client=None):
         super().__init__(parent)
         self.api_client = api_client
-        self.task_client = TaskClient()  # Uses default base_url
+        self.task_client = task_client or TaskClient()  # Uses default base_url
+        self.rpc = BackgroundRpc(self)
+        self.task_details = {}  # task id -> (list entry, fetched details)
+        self.tasks_by_id = {}
         layout = QVBoxLayout(self)
 
         # --- Engine Stats ---
@@ -337,11 +409,20 @@ class TaskEngineTab(QWidget):
         # --- Task List ---
         tasks_group = QGroupBox("Tasks")
         tasks_layout = QVBoxLayout(tasks_group)
-        self.tasks_table = QTableWidget(0, 5)
-        self.tasks_table.setHorizontalHeaderLabels(["ID", "Type", "Status", "Service", "Created"])
-        self.tasks_table.horizontalHeader().setStretchLastSection(True)
-        self.tasks_table.setSortingEnabled(True)
-        self.tasks_table.cellClicked.connect(self.show_task_details)
+        self.tasks_model = RecordTableModel(
+            [
+                ("ID", lambda t: t["id"]),
+                ("Type", lambda t: str(t.get("type", ""))),
+                ("Status", lambda t: t["status"]),
+                ("Service", lambda t: str(t.get("service", ""))),
+                ("Created", lambda t: str(t.get("created_at", ""))),
+            ],
+            key_field="id",
+            parent=self,
+            foreground=task_status_color,
+        )
+        self.tasks_table = make_table(self.tasks_model, sortable=True, parent=self)
+        self.tasks_table.clicked.connect(self.show_task_details)
         tasks_layout.addWidget(self.tasks_table)
         self.refresh_tasks_button = QPushButton("Refresh Tasks")
         self.refresh_tasks_button.clicked.connect(self.load_tasks)
@@ -364,56 +445,98 @@ class TaskEngineTab(QWidget):
 
     def load_stats(self):
         self.status_label.setText("Loading stats...")
-        try:
-            stats = self.task_client.get_statistics()
-            text = " | ".join(f"{k}: {v}" for k, v in stats.items())
-            self.stats_label.setText(text)
-            self.status_label.clear()
-        except Exception as e:
-            self.stats_label.setText(f"Error loading stats: {e}")
-            self.status_label.setText(f"Error loading stats: {e}")
+        self.rpc.call(
+            "stats",
+            self.task_client.get_statistics,
+            self.show_stats,
+            self.stats_failed,
+            supersede=True,
+        )
+
+    def show_stats(self, stats):
+        text = " | ".join(f"{k}: {v}" for k, v in stats.items())
+        self.stats_label.setText(text)
+        self.status_label.clear()
+
+    def stats_failed(self, error):
+        self.stats_label.setText(f"Error loading stats: {error}")
+        self.status_label.setText(f"Error loading stats: {error}")
 
     def load_tasks(self):
         self.status_label.setText("Loading tasks...")
-        self.tasks_table.setRowCount(0)
+        self.rpc.call(
+            "tasks",
+            self.task_client.get_tasks,
+            self.show_tasks,
+            lambda error: self.status_label.setText(f"Error loading tasks: {error}"),
+            supersede=True,
+        )
+
+    def show_tasks(self, tasks):
         try:
-            tasks = self.task_client.get_tasks()
-            self.tasks_table.setRowCount(len(tasks))
-            for i, task in enumerate(tasks):
-                self.tasks_table.setItem(i, 0, QTableWidgetItem(str(task.get("id", ""))))
-                self.tasks_table.setItem(i, 1, QTableWidgetItem(str(task.get("type", ""))))
-                # Status with color/icon
-                status = str(task.get("status", ""))
-                status_item = QTableWidgetItem(status)
-                if status == "COMPLETED":
-                    status_item.setForeground(QColor("green"))
-                elif status == "FAILED":
-                    status_item.setForeground(QColor("red"))
-                elif status == "RUNNING":
-                    status_item.setForeground(QColor("blue"))
-                else:
-                    status_item.setForeground(QColor("darkGray"))
-                self.tasks_table.setItem(i, 2, status_item)
-                self.tasks_table.setItem(i, 3, QTableWidgetItem(str(task.get("service", ""))))
-                self.tasks_table.setItem(i, 4, QTableWidgetItem(str(task.get("created_at", ""))))
+            tasks = [
+                dict(task, id=str(task.get("id", "")), status=str(task.get("status", "")))
+                for task in tasks
+            ]
+            # Details stay valid until the task's list entry changes
+            listed = {task["id"]: task for task in tasks}
+            self.task_details = {
+                task_id: cached
+                for task_id, cached in self.task_details.items()
+                if listed.get(task_id) == cached[0]
+            }
+            self.tasks_by_id = listed
+            self.tasks_model.update(tasks)
             self.status_label.clear()
         except Exception as e:
             self.status_label.setText(f"Error loading tasks: {e}")
 
-    def show_task_details(self, row, col):
-        try:
-            task_id = self.tasks_table.item(row, 0).text()
-            task = self.task_client.get_task(task_id)
-            self.details_text.setText(json.dumps(task, indent=2))
-        except Exception as e:
-            self.details_text.setText(f"Error loading task details: {e}")
+    def show_task_details(self, index):
+        row = self.tasks_table.model().mapToSource(index).row()
+        task_id = self.tasks_model.record(row)["id"]
+        cached = self.task_details.get(task_id)
+        if cached is not None:
+            self.details_text.setText(pretty_json(cached[1]))
+            return
+        # Only the most recently clicked task's details are shown
+        self.rpc.call(
+            "task_details",
+            lambda: self.task_client.get_task(task_id),
+            lambda task: self.task_details_loaded(task_id, task),
+            lambda error: self.details_text.setText(f"Error loading task details: {error}"),
+            supersede=True,
+        )
+
+    def task_details_loaded(self, task_id, task):
+        if task_id in self.tasks_by_id:
+            self.task_details[task_id] = (self.tasks_by_id[task_id], task)
+        self.details_text.setText(pretty_json(task))
 
     def test_api(self):
-        try:
-            stats = self.task_client.get_statistics()
-            QMessageBox.information(self, "API Test", f"Task Engine API is reachable. Stats: {stats}")
-        except Exception as e:
-            QMessageBox.critical(self, "API Test", f"Task Engine API error: {e}")
+        self.rpc.call(
+            "test_api",
+            self.task_client.get_statistics,
+            lambda stats: QMessageBox.information(
+                self, "API Test", f"Task Engine API is reachable. Stats: {stats}"
+            ),
+            lambda error: QMessageBox.critical(self, "API Test", f"Task Engine API error: {error}"),
+        )
+
+class LazyTab(QWidget):
+    """Tab page that builds its real widget the first time it is shown"""
+
+    def __init__(self, build, parent=None):
+        super().__init__(parent)
+        self.build = build
+        self.widget = None
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+    def showEvent(self, event):
+        if self.widget is None:
+            self.widget = self.build()
+            self.layout().addWidget(self.widget)
+        super().showEvent(event)
 
 class SettingsTab(QWidget):
     def __init__(self, parent=None):
@@ -425,60 +548,53 @@ class SettingsTab(QWidget):
 
 class MainWindow(QMainWindow):
     def __init__(self, api_client, wallet_client=None, *args, **kwargs):
-        print("MainWindow __init__ starting")
         super().__init__(*args, **kwargs)
-        print("super().__init__ done")
         self.api_client = api_client
-        print("api_client set")
         self.wallet_client = wallet_client
-        print("wallet_client set")
         self.current_user = None
+        # One client per service, shared by every tab that talks to it
+        self.escrow_client = EscrowClient()
+        self.task_client = TaskClient()
+        # One timer drives the periodic refreshes of the window's widgets
+        self.refresh_scheduler = RefreshScheduler(self)
         self.setWindowTitle("DuxOS API/App Store")
         self.resize(1200, 800)
-        print("Window title and size set")
 
         # --- Tabbed navigation ---
         self.tabs = QTabWidget()
         self.setCentralWidget(self.tabs)
-        print("QTabWidget created and set as central widget")
 
         # Store tab
         self.store_tab = StoreTab(self.api_client)
-        print("StoreTab created")
         self.tabs.addTab(self.store_tab, "Store")
-        print("StoreTab added")
-
-        # Wallet tab
-        self.wallet_tab = WalletTab(self.wallet_client)
-        print("WalletTab created")
-        self.tabs.addTab(self.wallet_tab, "Wallet")
-        print("WalletTab added")
 
-        # Task Engine tab
-        self.task_engine_tab = TaskEngineTab(self.api_client)
-        print("TaskEngineTab created")
-        self.tabs.addTab(self.task_engine_tab, "Task Engine")
-        print("TaskEngineTab added")
+        # Wallet and Task Engine tabs are built, and start loading, when first opened
+        self.wallet_tab = None
+        self.tabs.addTab(LazyTab(self.build_wallet_tab), "Wallet")
+        self.task_engine_tab = None
+        self.tabs.addTab(LazyTab(self.build_task_engine_tab), "Task Engine")
 
         # Settings tab
         self.settings_tab = SettingsTab()
-        print("SettingsTab created")
         self.tabs.addTab(self.settings_tab, "Settings")
-        print("SettingsTab added")
 
         # Modernize look & feel
         self.apply_theme("default")
-        print("Theme applied")
         self.settings_tab.settings_widget.settings_changed.connect(self.handle_settings_changed)
-        print("Settings changed signal connected")
 
         # Setup menu bar
         self.setup_menu_bar()
-        print("Menu bar set up")
 
         # User account dock
         self.setup_user_account_dock()
-        print("User account dock set up")
+
+    def build_wallet_tab(self):
+        self.wallet_tab = WalletTab(self.wallet_client, escrow_client=self.escrow_client)
+        return self.wallet_tab
+
+    def build_task_engine_tab(self):
+        self.task_engine_tab = TaskEngineTab(self.api_client, task_client=self.task_client)
+        return self.task_engine_tab
 
     def apply_theme(self, theme):
         if theme == "dark":
@@ -500,7 +616,9 @@ class MainWindow(QMainWindow):
 
     def setup_user_account_dock(self):
         if self.wallet_client:
-            self.user_account_widget = UserAccountWidget(self.api_client, self.wallet_client)
+            self.user_account_widget = UserAccountWidget(
+                self.api_client, self.wallet_client, refresh_scheduler=self.refresh_scheduler
+            )
             self.user_account_widget.login_requested.connect(self.handle_user_login)
             self.user_account_widget.logout_requested.connect(self.handle_user_logout)
             # Connect key access signals
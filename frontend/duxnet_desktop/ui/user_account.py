@@ -4,7 +4,13 @@ User Account Management for DuxOS Desktop
 Provides user login, wallet integration, and profile management.
 """
 
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+import json
+import os
+import re
+from functools import lru_cache, partial
+from urllib.parse import quote
+
+from PyQt5.QtCore import Qt, pyqtSignal, QStandardPaths, QTimer
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (
     QFormLayout,
@@ -21,6 +27,15 @@ from PyQt5.QtWidgets import (
     QApplication,
 )
 
+from .advanced_features import CURRENCIES, BackgroundRpc, RefreshScheduler
+
+USER_ID_RE = re.compile(r"[A-Za-z0-9_.-]{1,64}")
+
+
+@lru_cache(maxsize=None)
+def user_info_font():
+    """Profile heading font, shared by all account widgets once first used"""
+    return QFont("Arial", 12, QFont.Bold)
 
 
 class UserAccountWidget(QWidget):
@@ -29,12 +44,20 @@ class UserAccountWidget(QWidget):
     show_public_key_dialog = pyqtSignal(str, str)  # currency, password
     show_private_key_dialog = pyqtSignal(str, str)  # currency, password
 
-    def __init__(self, api_client, wallet_client, parent=None):
+    def __init__(self, api_client, wallet_client, parent=None, refresh_scheduler=None):
         super().__init__(parent)
         self.api_client = api_client
         self.wallet_client = wallet_client
         self.current_user = None
+        self.account_snapshot = {}  # last loaded wallet, balances and favorites
+        self.pending_account_data = {}  # loaded but not yet shown, by field
+        self.shown_texts = {}  # label -> text it was last given
+        # Wallet, balances and favorites load side by side
+        self.rpc = BackgroundRpc(self, max_workers=3)
         self.setup_ui()
+        # Reload while logged in; the profile is only visible then
+        self.refresh_scheduler = refresh_scheduler or RefreshScheduler(self)
+        self.refresh_scheduler.register(self.load_user_data, 15000, self.profile_group, jitter=0.2)
 
     def setup_ui(self):
         layout = QVBoxLayout(self)
@@ -60,6 +83,9 @@ class UserAccountWidget(QWidget):
         self.login_button.clicked.connect(self.login)
         login_layout.addRow("", self.login_button)
 
+        self.login_status_label = QLabel()
+        login_layout.addRow("", self.login_status_label)
+
         layout.addWidget(self.login_group)
 
         # User profile section (initially hidden)
@@ -69,7 +95,7 @@ class UserAccountWidget(QWidget):
 
         # User info
         self.user_info = QLabel("Not logged in")
-        self.user_info.setFont(QFont("Arial", 12, QFont.Bold))
+        self.user_info.setFont(user_info_font())
         profile_layout.addWidget(self.user_info)
 
         # Wallet info
@@ -88,7 +114,28 @@ class UserAccountWidget(QWidget):
         self.crypto_copy_buttons = {}
         self.crypto_pubkey_buttons = {}
         self.crypto_privkey_buttons = {}
-        for currency in ["BTC", "ETH", "FLOP", "USDT", "BNB", "XRP", "SOL", "ADA", "DOGE", "TON", "TRX"]:
+        self.crypto_row_widgets = {}
+        self.crypto_addresses = {}  # currency -> address as received, for copying
+        # The currency rows are built on first login
+        profile_layout.addWidget(self.crypto_balances_group)
+
+        # Favorites
+        self.favorites_label = QLabel("Favorites: 0")
+        profile_layout.addWidget(self.favorites_label)
+
+        # Logout button
+        self.logout_button = QPushButton("Logout")
+        self.logout_button.clicked.connect(self.logout)
+        profile_layout.addWidget(self.logout_button)
+
+        layout.addWidget(self.profile_group)
+        layout.addStretch()
+
+    def build_crypto_rows(self):
+        """Create the per-currency balance rows the first time the profile is shown"""
+        if self.crypto_row_widgets:
+            return
+        for currency in CURRENCIES:
             balance_label = QLabel("0.0")
             address_label = QLabel("-")
             powered_by_label = QLabel("")
@@ -96,7 +143,8 @@ class UserAccountWidget(QWidget):
             copy_button = QToolButton()
             copy_button.setText("Copy")
             copy_button.setToolTip(f"Copy {currency} address")
-            copy_button.clicked.connect(lambda checked, c=currency: self.copy_crypto_address(c))
+            copy_button.setProperty("currency", currency)
+            copy_button.clicked.connect(self.copy_clicked)
             pubkey_button = QToolButton()
             pubkey_button.setText("Public Key")
             pubkey_button.setToolTip(f"Show {currency} public key")
@@ -120,20 +168,8 @@ class UserAccountWidget(QWidget):
             row_layout.addWidget(pubkey_button)
             row_layout.addWidget(privkey_button)
             row_widget.powered_by_label = powered_by_label
+            self.crypto_row_widgets[currency] = row_widget
             self.crypto_balances_layout.addRow(f"{currency}:", row_widget)
-        profile_layout.addWidget(self.crypto_balances_group)
-
-        # Favorites
-        self.favorites_label = QLabel("Favorites: 0")
-        profile_layout.addWidget(self.favorites_label)
-
-        # Logout button
-        self.logout_button = QPushButton("Logout")
-        self.logout_button.clicked.connect(self.logout)
-        profile_layout.addWidget(self.logout_button)
-
-        layout.addWidget(self.profile_group)
-        layout.addStretch()
 
     def login(self):
         """Handle user login"""
@@ -143,15 +179,27 @@ class UserAccountWidget(QWidget):
 
         if not user_id or not user_name or not password:
             return  # Should show error message
+        # A malformed ID would only come back as a 404
+        if not USER_ID_RE.fullmatch(user_id):
+            self.login_status_label.setText("Invalid user ID")
+            return
+        self.login_status_label.clear()
 
+        # Ignore repeated clicks until this session is logged out
+        self.login_button.setEnabled(False)
         self.current_user = {"user_id": user_id, "user_name": user_name, "password": password}
 
         # Update UI
+        self.build_crypto_rows()
         self.login_group.setVisible(False)
         self.profile_group.setVisible(True)
 
-        # Load user data
-        self.load_user_data()
+        # Show the last known account data while it reloads
+        self.account_snapshot = self.read_account_snapshot(user_id)
+        self.show_account_snapshot(self.account_snapshot)
+
+        # Load user data; loads still running for a previous session are replaced
+        self.load_user_data(supersede=True)
 
         # Emit signal
         self.login_requested.emit(user_id, user_name, password)
@@ -159,10 +207,13 @@ class UserAccountWidget(QWidget):
     def logout(self):
         """Handle user logout"""
         self.current_user = None
+        self.pending_account_data = {}
+        self.clear_profile()
 
         # Update UI
         self.login_group.setVisible(True)
         self.profile_group.setVisible(False)
+        self.login_button.setEnabled(True)
 
         # Clear inputs
         self.user_id_input.clear()
@@ -172,73 +223,186 @@ class UserAccountWidget(QWidget):
         # Emit signal
         self.logout_requested.emit()
 
-    def load_user_data(self):
+    def clear_profile(self):
+        """Reset the profile to its placeholders so nothing of the last user is left"""
+        self.account_snapshot = {}
+        self.crypto_addresses.clear()
+        self.shown_texts.clear()
+        self.user_info.setText("Not logged in")
+        self.wallet_address_label.setText("Not connected")
+        self.balance_label.setText("0.0 FLOP")
+        for label in self.crypto_balance_labels.values():
+            label.setText("0.0")
+        for label in self.crypto_address_labels.values():
+            label.setText("-")
+        for row_widget in self.crypto_row_widgets.values():
+            row_widget.powered_by_label.setText("")
+            row_widget.powered_by_label.setToolTip("")
+        self.favorites_label.setText("Favorites: 0")
+
+    def load_user_data(self, supersede=False):
         """Load and display user data"""
         if not self.current_user:
             return
 
         user_id = self.current_user["user_id"]
         user_name = self.current_user["user_name"]
-        password = self.current_user["password"]
 
         # Update user info
         self.user_info.setText(f"Welcome, {user_name}!")
 
-        # Load wallet info
-        try:
-            wallet = self.wallet_client.get_wallet(user_id, password=password)
-            if wallet:
-                self.wallet_address_label.setText(wallet.get("address", "Unknown"))
-                self.balance_label.setText(f"{wallet.get('balance', 0.0):.2f} FLOP")
-            else:
-                self.wallet_address_label.setText("No wallet found")
-                self.balance_label.setText("0.0 FLOP")
-        except Exception as e:
-            self.wallet_address_label.setText("Error loading wallet")
-            self.balance_label.setText("0.0 FLOP")
+        # A refresh skips loads that are still in flight
+        self.rpc.call(
+            "wallet",
+            lambda: self.wallet_client.get_wallet(user_id),
+            self.for_user(user_id, partial(self.account_loaded, "wallet")),
+            self.for_user(user_id, self.wallet_failed),
+            supersede=supersede,
+        )
+        self.rpc.call(
+            "balances",
+            lambda: self.wallet_client.get_all_balances(),
+            self.for_user(user_id, partial(self.account_loaded, "balances")),
+            self.for_user(user_id, self.balances_failed),
+            supersede=supersede,
+        )
+        self.rpc.call(
+            "favorites",
+            lambda: self.api_client.get_user_favorites(user_id),
+            self.for_user(user_id, partial(self.account_loaded, "favorites")),
+            self.for_user(user_id, self.favorites_failed),
+            supersede=supersede,
+        )
+
+    def account_loaded(self, field, value):
+        """Queue freshly loaded account data; data arriving together is shown in one update"""
+        if not self.pending_account_data:
+            QTimer.singleShot(0, self.flush_account_data)
+        self.pending_account_data[field] = value
+
+    def flush_account_data(self):
+        """Show the queued account data and keep it for the next login"""
+        pending, self.pending_account_data = self.pending_account_data, {}
+        if not pending or not self.current_user:
+            return
+        self.show_account_snapshot(pending)
+        self.account_snapshot.update(pending)
+        self.write_account_snapshot(self.current_user["user_id"], self.account_snapshot)
 
-        # Load multi-crypto balances
+    def show_account_snapshot(self, snapshot):
+        # One repaint for the whole profile rather than one per label
+        self.setUpdatesEnabled(False)
+        try:
+            if "wallet" in snapshot:
+                self.show_wallet(snapshot["wallet"])
+            if "balances" in snapshot:
+                self.show_balances(snapshot["balances"])
+            if "favorites" in snapshot:
+                self.show_favorites(snapshot["favorites"])
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def snapshot_path(self, user_id):
+        app_data = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+        return os.path.join(app_data, "accounts", f"{quote(user_id, safe='')}.json")
+
+    def read_account_snapshot(self, user_id):
+        try:
+            with open(self.snapshot_path(user_id), encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return snapshot if isinstance(snapshot, dict) else {}
+
+    def write_account_snapshot(self, user_id, snapshot):
+        path = self.snapshot_path(user_id)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write a whole new file so a crash never leaves a truncated one behind
+            with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+                json.dump(snapshot, f)
+            os.replace(f"{path}.tmp", path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Error saving account snapshot: {e}")
+
+    def for_user(self, user_id, slot):
+        """Wrap a result slot so results arriving after that user logged out are dropped"""
+
+        def call_slot(value):
+            if self.current_user and self.current_user["user_id"] == user_id:
+                slot(value)
+
+        return call_slot
+
+    def set_label_text(self, label, text):
+        """Set a label's text, skipping the relayout if it already shows it"""
+        if self.shown_texts.get(label) != text:
+            label.setText(text)
+            self.shown_texts[label] = text
+
+    def show_wallet(self, wallet):
+        if wallet:
+            self.set_label_text(self.wallet_address_label, wallet.get("address", "Unknown"))
+            self.set_label_text(self.balance_label, f"{wallet.get('balance', 0.0):.2f} FLOP")
+        else:
+            self.set_label_text(self.wallet_address_label, "No wallet found")
+            self.set_label_text(self.balance_label, "0.0 FLOP")
+
+    def wallet_failed(self, error):
+        self.set_label_text(self.wallet_address_label, "Error loading wallet")
+        self.set_label_text(self.balance_label, "0.0 FLOP")
+
+    def show_balances(self, balances):
+        # Repaint the currency rows once, after all of them are updated
+        self.crypto_balances_group.setUpdatesEnabled(False)
         try:
-            balances = self.wallet_client.get_all_balances(password=password)
             for currency in self.crypto_balance_labels.keys():
                 value = balances.get(currency, {}).get("balance", 0.0)
                 address = balances.get(currency, {}).get("address", "-")
                 powered_by = balances.get(currency, {}).get("powered_by", "")
                 if self.crypto_balance_labels.get(currency):
-                    self.crypto_balance_labels[currency].setText(f"{value:.8f}")
+                    self.set_label_text(self.crypto_balance_labels[currency], f"{value:.8f}")
                 if self.crypto_address_labels.get(currency):
-                    self.crypto_address_labels[currency].setText(address)
+                    self.set_label_text(self.crypto_address_labels[currency], address)
+                self.crypto_addresses[currency] = address
                 # Show Trust Wallet badge/tooltip if powered by wallet-core
-                row_widget = self.crypto_balances_layout.itemAt(self.crypto_balances_layout.rowCount()-1, 1).widget()
-                if hasattr(row_widget, 'powered_by_label'):
-                    if powered_by == "wallet-core":
-                        row_widget.powered_by_label.setText("Trust Wallet")
-                        row_widget.powered_by_label.setToolTip("Powered by Trust Wallet wallet-core")
-                    else:
-                        row_widget.powered_by_label.setText("")
-                        row_widget.powered_by_label.setToolTip("")
+                powered_by_label = self.crypto_row_widgets[currency].powered_by_label
+                if powered_by == "wallet-core":
+                    self.set_label_text(powered_by_label, "Trust Wallet")
+                    powered_by_label.setToolTip("Powered by Trust Wallet wallet-core")
+                else:
+                    self.set_label_text(powered_by_label, "")
+                    powered_by_label.setToolTip("")
         except Exception as e:
-            for label in self.crypto_balance_labels.values():
-                if label:
-                    label.setText("Error")
-            for label in self.crypto_address_labels.values():
-                if label:
-                    label.setText("Error")
-
-        # Load favorites
-        try:
-            favorites = self.api_client.get_user_favorites(user_id)
-            self.favorites_label.setText(f"Favorites: {len(favorites)}")
-        except Exception as e:
-            self.favorites_label.setText("Favorites: Error loading")
+            self.balances_failed(e)
+        finally:
+            self.crypto_balances_group.setUpdatesEnabled(True)
+
+    def balances_failed(self, error):
+        self.crypto_addresses.clear()
+        for label in self.crypto_balance_labels.values():
+            if label:
+                self.set_label_text(label, "Error")
+        for label in self.crypto_address_labels.values():
+            if label:
+                self.set_label_text(label, "Error")
+
+    def show_favorites(self, favorites):
+        self.set_label_text(self.favorites_label, f"Favorites: {len(favorites)}")
+
+    def favorites_failed(self, error):
+        self.set_label_text(self.favorites_label, "Favorites: Error loading")
+
+    def copy_clicked(self):
+        self.copy_crypto_address(self.sender().property("currency"))
 
     def copy_crypto_address(self, currency):
-        address = self.crypto_address_labels[currency].text()
+        address = self.crypto_addresses.get(currency)
         if address and address != "-":
-            clipboard = QApplication.clipboard()
-            clipboard.setText(address)
-            self.crypto_copy_buttons[currency].setToolTip("Copied!")
-            QTimer.singleShot(1200, lambda: self.crypto_copy_buttons[currency].setToolTip(f"Copy {currency} address"))
+            QApplication.clipboard().setText(address)
+            copy_button = self.crypto_copy_buttons[currency]
+            copy_button.setToolTip("Copied!")
+            QTimer.singleShot(1200, partial(copy_button.setToolTip, f"Copy {currency} address"))
 
     def get_password(self):
         if self.current_user:
@@ -4,23 +4,53 @@ Wallet Client for DuxOS Desktop
 Handles wallet operations and user account management via duxnet_wallet API.
 """
 
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, Optional
 
 import requests
 
+from .http_session import SESSION, response_json
+from .response_cache import memoize
+
 WALLET_API_URL = "http://localhost:8002"  # Can be made configurable
 
+CURRENCIES = ("BTC", "ETH", "FLOP", "USDT", "BNB", "XRP", "SOL", "ADA", "DOGE", "TON", "TRX")
+
+# Per-currency balance lookups, used when the aggregate endpoint fails
+_balance_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="wallet-balance")
+
 
 class WalletClient:
-    def __init__(self, base_url: str = WALLET_API_URL):
+    def __init__(self, base_url: str = WALLET_API_URL, session: Optional[requests.Session] = None):
         self.base_url = base_url.rstrip("/")
+        self.session = session or SESSION
+        self.etag_cache: Dict[str, tuple] = {}  # url -> (ETag, decoded body)
 
+    def _get_json(self, url: str) -> Any:
+        """
+        GET and decode a JSON body, revalidating with the ETag of the last
+        response from url, so an unchanged body comes back as a bodiless 304
+        and is not downloaded or decoded again.
+        """
+        cached = self.etag_cache.get(url)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = self.session.get(url, headers=headers)
+        if response.status_code == 304 and cached:
+            return cached[1]
+        data = response_json(response)
+        etag = response.headers.get("ETag")
+        if etag:
+            self.etag_cache[url] = (etag, data)
+        else:
+            self.etag_cache.pop(url, None)
+        return data
+
+    @memoize(stale_ms=5000, ttl_ms=15000)
     def get_wallet(self, user_id: str) -> Optional[Dict[str, Any]]:
-        response = requests.get(f"{self.base_url}/wallet/{user_id}")
+        response = self.session.get(f"{self.base_url}/wallet/{user_id}")
         if response.status_code == 404:
             return None
-        response.raise_for_status()
-        return response.json()
+        return response_json(response)
 
     def get_balance(self, user_id: Optional[str] = None, currency: str = "FLOP") -> Optional[float]:
         if user_id:
@@ -31,53 +61,83 @@ class WalletClient:
         else:
             # Direct balance query for multi-crypto
             try:
-                response = requests.get(f"{self.base_url}/balance/{currency}")
-                response.raise_for_status()
-                return response.json().get("balance", 0.0)
+                response = self.session.get(f"{self.base_url}/balance/{currency}")
+                return response_json(response).get("balance", 0.0)
             except Exception as e:
                 print(f"Error getting {currency} balance: {e}")
                 return 0.0
 
     def send_payment(self, from_user: str, to_address: str, amount: float) -> Dict[str, Any]:
         payload = {"from_user": from_user, "to_address": to_address, "amount": amount}
-        response = requests.post(f"{self.base_url}/wallet/send", json=payload)
-        response.raise_for_status()
-        return response.json()
+        response = self.session.post(f"{self.base_url}/wallet/send", json=payload)
+        self.invalidate()
+        return response_json(response)
+
+    def invalidate(self) -> None:
+        """Drop cached wallet state, e.g. after sending funds"""
+        self.get_wallet.cache_clear()
+        self.get_all_balances.cache_clear()
+        self._fetch_transaction_history.cache_clear()
 
     def get_transactions(self, user_id: str) -> list:
-        response = requests.get(f"{self.base_url}/wallet/{user_id}/transactions")
-        response.raise_for_status()
-        return response.json()
+        response = self.session.get(f"{self.base_url}/wallet/{user_id}/transactions")
+        return response_json(response)
 
+    @memoize(stale_ms=5000, ttl_ms=60000)
     def get_all_balances(self) -> Dict[str, Dict[str, Any]]:
-        """Get balances for all supported currencies"""
+        """
+        Get balances for all supported currencies. Raises when neither the
+        aggregate endpoint nor any per-currency lookup answers, so an
+        all-zero placeholder map is never cached.
+        """
         try:
-            response = requests.get(f"{self.base_url}/balances")
-            response.raise_for_status()
-            return response.json()
+            return self._get_json(f"{self.base_url}/balances")
         except Exception as e:
             print(f"Error getting all balances: {e}")
-            return {
-                "BTC": {"balance": 0.0, "address": "unknown"},
-                "ETH": {"balance": 0.0, "address": "unknown"},
-                "FLOP": {"balance": 0.0, "address": "unknown"},
-                "USDT": {"balance": 0.0, "address": "unknown"},
-                "BNB": {"balance": 0.0, "address": "unknown"},
-                "XRP": {"balance": 0.0, "address": "unknown"},
-                "SOL": {"balance": 0.0, "address": "unknown"},
-                "ADA": {"balance": 0.0, "address": "unknown"},
-                "DOGE": {"balance": 0.0, "address": "unknown"},
-                "TON": {"balance": 0.0, "address": "unknown"},
-                "TRX": {"balance": 0.0, "address": "unknown"}
-            }
+            balances, failed = self._collect_balances(CURRENCIES, 2.0)
+            if len(failed) == len(balances):
+                raise
+            return balances
+
+    def get_all_balances_parallel(
+        self, currencies: Iterable[str] = CURRENCIES, timeout: float = 2.0
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get balances with one request per currency, all in flight at once.
+        Currencies that fail or miss the timeout report a zero balance.
+
+        Blocks for up to timeout seconds, so call it from a worker thread
+        (e.g. through BackgroundRpc), never from the GUI thread.
+        """
+        return self._collect_balances(currencies, timeout)[0]
+
+    def _collect_balances(self, currencies: Iterable[str], timeout: float) -> tuple:
+        """Per-currency balances, plus the currencies that fell back to zero"""
+        futures = {
+            currency: _balance_pool.submit(self._get_currency_balance, currency)
+            for currency in currencies
+        }
+        done, _ = wait(futures.values(), timeout=timeout)
+        balances, failed = {}, set()
+        for currency, future in futures.items():
+            if future in done and future.exception() is None:
+                balances[currency] = future.result()
+            else:
+                balances[currency] = {"balance": 0.0, "address": "unknown"}
+                failed.add(currency)
+        return balances, failed
+
+    def _get_currency_balance(self, currency: str) -> Dict[str, Any]:
+        data = self._get_json(f"{self.base_url}/balance/{currency}")
+        return {"balance": data.get("balance", 0.0), "address": data.get("address", "unknown")}
 
     def send_transaction(self, currency: str, to_address: str, amount: float) -> Dict[str, Any]:
         """Send transaction for specific currency"""
         try:
             data = {"currency": currency, "to_address": to_address, "amount": amount}
-            response = requests.post(f"{self.base_url}/send", json=data)
-            response.raise_for_status()
-            return response.json()
+            response = self.session.post(f"{self.base_url}/send", json=data)
+            self.invalidate()
+            return response_json(response)
         except Exception as e:
             print(f"Error sending {currency} transaction: {e}")
             return {"txid": "unknown"}
@@ -85,9 +145,12 @@ class WalletClient:
     def get_transaction_history(self, currency: str = "FLOP", limit: int = 10) -> list:
         """Get transaction history for specific currency"""
         try:
-            response = requests.get(f"{self.base_url}/transactions/{currency}?limit={limit}")
-            response.raise_for_status()
-            return response.json()
+            return self._fetch_transaction_history(currency, limit)
         except Exception as e:
             print(f"Error getting {currency} transaction history: {e}")
             return []
+
+    @memoize(stale_ms=5000, ttl_ms=15000)
+    def _fetch_transaction_history(self, currency: str, limit: int) -> list:
+        # Raises on failure so errors are never memoized
+        return self._get_json(f"{self.base_url}/transactions/{currency}?limit={limit}")
@@ -7,6 +7,7 @@ A comprehensive health monitoring system for decentralized Linux distribution no
 import argparse
 import asyncio
 import base64
+import gzip
 import hashlib
 import json
 import logging
@@ -21,8 +22,8 @@ from datetime import datetime, timedelta
 from functools import wraps
 from typing import Any, Dict, List, Optional
 
+import aiohttp
 import psutil
-import requests
 import yaml
 
 # Optional imports with fallbacks
@@ -36,6 +37,20 @@ except ImportError:
     CRYPTOGRAPHY_AVAILABLE = False
     logging.warning("cryptography library not available, signature features disabled")
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 try:
     import websockets
     from websockets.server import serve as ws_serve
@@ -47,7 +62,7 @@ except ImportError:
 
 import sqlite3
 import threading
-from collections import defaultdict, deque
+from collections import OrderedDict
 from sqlite3 import Connection
 
 # Import the base daemon class
@@ -65,6 +80,16 @@ except ImportError:
             pass
 
 
+def json_bytes(data: Any, sort_keys: bool = False) -> bytes:
+    """Encode data as compact UTF-8 JSON, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return json.dumps(data, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
 @dataclass
 class NodeMetrics:
     """Node health metrics data structure"""
@@ -99,23 +124,22 @@ class RateLimiter:
     def __init__(self, max_requests: int, window_seconds: int = 60):
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests = defaultdict(deque)
+        self.window = None  # index of the current fixed window
+        self.counts: Dict[str, int] = {}  # identifier -> requests in the current window
         self.lock = threading.Lock()
 
     def is_allowed(self, identifier: str) -> bool:
         """Check if request is allowed based on rate limiting"""
-        now = time.time()
+        window = int(time.time()) // self.window_seconds
         with self.lock:
-            # Clean old requests
-            while (
-                self.requests[identifier]
-                and self.requests[identifier][0] < now - self.window_seconds
-            ):
-                self.requests[identifier].popleft()
-
-            # Check if under limit
-            if len(self.requests[identifier]) < self.max_requests:
-                self.requests[identifier].append(now)
+            # Counts from a previous window no longer matter
+            if window != self.window:
+                self.window = window
+                self.counts.clear()
+
+            count = self.counts.get(identifier, 0)
+            if count < self.max_requests:
+                self.counts[identifier] = count + 1
                 return True
             return False
 
@@ -154,7 +178,7 @@ class IPFSStorage:
     def __init__(self, endpoint: str, config: Dict[str, Any]):
         self.endpoint = endpoint
         self.config = config
-        self.cache = {}
+        self.cache = OrderedDict()  # content hash -> IPFS hash, least recently used first
         self.cache_size = (
             config.get("ipfs_optimization", {}).get("cache_size_mb", 100) * 1024 * 1024
         )
@@ -163,27 +187,22 @@ class IPFSStorage:
     async def store_health_data(self, health_data: Dict[str, Any]) -> str:
         """Store health data to IPFS with compression and deduplication"""
         try:
-            # Compress data if enabled
-            if self.config.get("ipfs_optimization", {}).get("compression", True):
-                import gzip
-
-                data_bytes = json.dumps(health_data).encode("utf-8")
-                compressed_data = gzip.compress(data_bytes)
-                health_data["_compressed"] = True
-                health_data["_original_size"] = len(data_bytes)
-                health_data["_compressed_size"] = len(compressed_data)
-
-            # Generate content hash for deduplication
-            content_hash = hashlib.sha256(
-                json.dumps(health_data, sort_keys=True).encode()
-            ).hexdigest()
+            # One canonical encoding serves as both the dedup key and the stored content
+            data_bytes = json_bytes(health_data, sort_keys=True)
+            content_hash = hashlib.sha256(data_bytes).hexdigest()
 
             # Check cache first
             if content_hash in self.cache:
+                self.cache.move_to_end(content_hash)
                 return self.cache[content_hash]
 
+            # Compress data if enabled; level 1 is several times faster than
+            # the default on JSON for a slightly larger output
+            if self.config.get("ipfs_optimization", {}).get("compression", True):
+                data_bytes = gzip.compress(data_bytes, compresslevel=1)
+
             # Store to IPFS (placeholder implementation)
-            # In real implementation, this would use IPFS HTTP API
+            # In real implementation, this would add data_bytes via the IPFS HTTP API
             ipfs_hash = f"Qm{content_hash[:44]}"  # Placeholder IPFS hash
 
             # Cache the result
@@ -199,12 +218,10 @@ class IPFSStorage:
         """Add to cache with size management"""
         cache_entry_size = len(content_hash) + len(ipfs_hash)
 
-        # Remove old entries if cache is full
+        # Remove least recently used entries if cache is full
         while self.current_cache_size + cache_entry_size > self.cache_size and self.cache:
-            oldest_key = next(iter(self.cache))
-            removed_size = len(oldest_key) + len(self.cache[oldest_key])
-            del self.cache[oldest_key]
-            self.current_cache_size -= removed_size
+            oldest_key, oldest_hash = self.cache.popitem(last=False)
+            self.current_cache_size -= len(oldest_key) + len(oldest_hash)
 
         self.cache[content_hash] = ipfs_hash
         self.current_cache_size += cache_entry_size
@@ -219,7 +236,7 @@ class DynamicThresholds:
         self.last_update = 0
         self.update_interval = config.get("dynamic_thresholds", {}).get("update_interval", 3600)
 
-    async def update_thresholds(self):
+    async def update_thresholds(self, session: aiohttp.ClientSession):
         """Update thresholds from governance layer"""
         try:
             if not self.config.get("dynamic_thresholds", {}).get("enabled", False):
@@ -235,12 +252,12 @@ class DynamicThresholds:
             if not governance_endpoint:
                 return
 
-            response = requests.get(governance_endpoint, timeout=10)
-            if response.status_code == 200:
-                new_thresholds = response.json()
-                self.thresholds.update(new_thresholds)
-                self.last_update = now
-                logging.info(f"Updated thresholds from governance layer: {new_thresholds}")
+            async with session.get(governance_endpoint) as response:
+                if response.status == 200:
+                    new_thresholds = await response.json()
+                    self.thresholds.update(new_thresholds)
+                    self.last_update = now
+                    logging.info(f"Updated thresholds from governance layer: {new_thresholds}")
 
         except Exception as e:
             logging.warning(f"Failed to update thresholds from governance layer: {e}")
@@ -252,6 +269,7 @@ class ProofOfComputation:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.task_results_cache = {}
+        self._private_key = None  # loaded on first signature
 
     def generate_proof(self, task_results: List[Dict[str, Any]]) -> str:
         """Generate proof-of-computation from task results"""
@@ -276,7 +294,7 @@ class ProofOfComputation:
             signature = private_key.sign(proof_bytes)
 
             proof_data["signature"] = base64.b64encode(signature).decode()
-            return base64.b64encode(json.dumps(proof_data).encode()).decode()
+            return base64.b64encode(json_bytes(proof_data)).decode()
 
         except Exception as e:
             logging.error(f"Failed to generate proof-of-computation: {e}")
@@ -289,7 +307,7 @@ class ProofOfComputation:
                 logging.warning("Cryptography not available, skipping proof verification")
                 return False
 
-            proof_data = json.loads(base64.b64decode(proof).decode())
+            proof_data = json_loads(base64.b64decode(proof))
             signature = base64.b64decode(proof_data["signature"])
             proof_bytes = json.dumps(
                 {k: v for k, v in proof_data.items() if k != "signature"}, sort_keys=True
@@ -303,12 +321,13 @@ class ProofOfComputation:
             logging.error(f"Failed to verify proof-of-computation: {e}")
             return False
 
-    def _load_private_key(self) -> ed25519.Ed25519PrivateKey:
-        """Load private key for signing"""
-        key_path = self.config["security"]["private_key_path"]
-        with open(key_path, "rb") as f:
-            private_key = ed25519.Ed25519PrivateKey.from_private_bytes(f.read())
-        return private_key
+    def _load_private_key(self) -> "ed25519.Ed25519PrivateKey":
+        """Load private key for signing, reading the key file only once"""
+        if self._private_key is None:
+            key_path = self.config["security"]["private_key_path"]
+            with open(key_path, "rb") as f:
+                self._private_key = ed25519.Ed25519PrivateKey.from_private_bytes(f.read())
+        return self._private_key
 
 
 class HealthMonitorDaemon(DuxOSDaemon):
@@ -337,6 +356,9 @@ class HealthMonitorDaemon(DuxOSDaemon):
         self.websocket_clients = set()
         self.websocket_server = None
 
+        # HTTP session for registry and governance calls, opened in run_async
+        self.http: Optional[aiohttp.ClientSession] = None
+
         # Batch processing
         self.health_batch = []
         self.batch_lock = threading.Lock()
@@ -378,6 +400,9 @@ class HealthMonitorDaemon(DuxOSDaemon):
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
 
         conn = sqlite3.connect(db_path)
+        # WAL with NORMAL sync makes each heartbeat commit an append instead of an fsync
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS health_history (
@@ -392,6 +417,11 @@ class HealthMonitorDaemon(DuxOSDaemon):
             )
         """
         )
+        # Serves the retention DELETE and the newest-first filter queries
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_health_history_timestamp "
+            "ON health_history (timestamp)"
+        )
         conn.commit()
         return conn
 
@@ -541,14 +571,11 @@ class HealthMonitorDaemon(DuxOSDaemon):
 
             # Send to registry with exponential backoff
             async def send_request():
-                response = requests.post(
-                    f"https://registry.duxos.net/nodes/health",
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                    timeout=10,
-                )
-                response.raise_for_status()
-                return response.json()
+                async with self.http.post(
+                    "https://registry.duxos.net/nodes/health", json=payload
+                ) as response:
+                    response.raise_for_status()
+                    return await response.json()
 
             result = await self.backoff.retry(send_request)
 
@@ -581,7 +608,7 @@ class HealthMonitorDaemon(DuxOSDaemon):
                 (
                     health_data["node_id"],
                     health_data["status"],
-                    json.dumps(health_data["metrics"]),
+                    json_bytes(health_data["metrics"]).decode(),
                     health_data["signature"],
                     health_data.get("proof_of_computation", ""),
                     ipfs_hash,
@@ -589,40 +616,49 @@ class HealthMonitorDaemon(DuxOSDaemon):
             )
             self.db_conn.commit()
 
-            # Clean old data
+        except Exception as e:
+            logging.error(f"Failed to store health data: {e}")
+
+    def _prune_health_history(self):
+        """Delete health data older than the retention period"""
+        try:
             retention_days = self.config["health_monitor"]["health_history_retention"] // 86400
             self.db_conn.execute(
-                """
-                DELETE FROM health_history 
-                WHERE timestamp < datetime('now', '-{} days')
-            """.format(
-                    retention_days
-                )
+                "DELETE FROM health_history WHERE timestamp < datetime('now', ?)",
+                (f"-{retention_days} days",),
             )
             self.db_conn.commit()
 
         except Exception as e:
-            logging.error(f"Failed to store health data: {e}")
+            logging.error(f"Failed to prune health history: {e}")
+
+    async def prune_health_history(self):
+        """Prune old health data hourly rather than on every heartbeat"""
+        while self.running:
+            self._prune_health_history()
+            await asyncio.sleep(3600)
 
     async def _broadcast_health_update(self, health_data: Dict[str, Any]):
         """Broadcast health update to WebSocket clients"""
         if not self.websocket_clients or not WEBSOCKETS_AVAILABLE:
             return
 
-        message = json.dumps(
+        message = json_bytes(
             {
                 "type": "health_update",
                 "data": health_data,
                 "timestamp": datetime.utcnow().isoformat(),
             }
-        )
+        ).decode()
 
-        disconnected_clients = set()
-        for client in self.websocket_clients:
-            try:
-                await client.send(message)
-            except Exception:
-                disconnected_clients.add(client)
+        # Send to all clients at once so one slow client does not delay the rest
+        clients = list(self.websocket_clients)
+        results = await asyncio.gather(
+            *(client.send(message) for client in clients), return_exceptions=True
+        )
+        disconnected_clients = {
+            client for client, result in zip(clients, results) if isinstance(result, Exception)
+        }
 
         # Remove disconnected clients
         self.websocket_clients -= disconnected_clients
@@ -636,7 +672,7 @@ class HealthMonitorDaemon(DuxOSDaemon):
         try:
             async for message in websocket:
                 # Handle client messages (e.g., filter requests)
-                data = json.loads(message)
+                data = json_loads(message)
                 if data.get("type") == "filter_request":
                     await self._handle_filter_request(websocket, data)
         except Exception as e:
@@ -675,7 +711,7 @@ class HealthMonitorDaemon(DuxOSDaemon):
                         "node_id": row[1],
                         "timestamp": row[2],
                         "status": row[3],
-                        "metrics": json.loads(row[4]),
+                        "metrics": json_loads(row[4]),
                         "signature": row[5],
                         "proof_of_computation": row[6],
                         "ipfs_hash": row[7],
@@ -689,7 +725,7 @@ class HealthMonitorDaemon(DuxOSDaemon):
                 "timestamp": datetime.utcnow().isoformat(),
             }
 
-            await websocket.send(json.dumps(response))
+            await websocket.send(json_bytes(response).decode())
 
         except Exception as e:
             logging.error(f"Failed to handle filter request: {e}")
@@ -705,7 +741,10 @@ class HealthMonitorDaemon(DuxOSDaemon):
             host, port = ws_endpoint.replace("ws://", "").split(":")
             port = int(port)
 
-            self.websocket_server = await ws_serve(self.websocket_handler, host, port)
+            # Health updates are small; per-client deflate would cost more CPU than it saves
+            self.websocket_server = await ws_serve(
+                self.websocket_handler, host, port, compression=None
+            )
             logging.info(f"WebSocket server started on {ws_endpoint}")
 
         except Exception as e:
@@ -749,6 +788,8 @@ class HealthMonitorDaemon(DuxOSDaemon):
 
     async def run_async(self):
         """Main async run loop"""
+        # Heartbeats and threshold updates share pooled connections and never block the loop
+        self.http = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
         try:
             # Start WebSocket server
             if WEBSOCKETS_AVAILABLE:
@@ -756,6 +797,7 @@ class HealthMonitorDaemon(DuxOSDaemon):
 
             # Start batch processing
             batch_task = asyncio.create_task(self.batch_process_health_data())
+            prune_task = asyncio.create_task(self.prune_health_history())
 
             # Main heartbeat loop
             heartbeat_interval = self.config["health_monitor"]["heartbeat_interval"]
@@ -763,7 +805,7 @@ class HealthMonitorDaemon(DuxOSDaemon):
             while self.running:
                 try:
                     # Update dynamic thresholds
-                    await self.dynamic_thresholds.update_thresholds()
+                    await self.dynamic_thresholds.update_thresholds(self.http)
 
                     # Send heartbeat
                     success = await self.send_heartbeat()
@@ -780,19 +822,24 @@ class HealthMonitorDaemon(DuxOSDaemon):
 
             # Cleanup
             batch_task.cancel()
+            prune_task.cancel()
             if self.websocket_server and WEBSOCKETS_AVAILABLE:
                 self.websocket_server.close()
                 await self.websocket_server.wait_closed()
 
         except Exception as e:
             logging.error(f"Fatal error in async run loop: {e}")
+        finally:
+            await self.http.close()
 
     def run(self):
         """Main run method (synchronous wrapper for async)"""
         logging.info("Health Monitor Daemon starting...")
 
         try:
-            # Run the async loop
+            # Run the async loop, on libuv when uvloop is installed
+            if UVLOOP_AVAILABLE:
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
             asyncio.run(self.run_async())
         except KeyboardInterrupt:
             logging.info("Received interrupt signal, shutting down...")
@@ -0,0 +1,154 @@
+"""
+Result Verifier Tests
+
+Tests for task result verification: hash checks, format/range rules
+and verification statistics.
+"""
+
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from duxos_tasks.models import HashInput, TaskResult, TaskStatus
+from duxos_tasks.result_verifier import ResultVerifier, VerificationRule
+
+
+@pytest.fixture
+def verifier():
+    """Create a result verifier for testing"""
+    return ResultVerifier()
+
+
+def make_result(output_data, result_hash=None, task_id="task_001"):
+    """Build a completed task result"""
+    return TaskResult(
+        task_id=task_id,
+        node_id="node_001",
+        status=TaskStatus.COMPLETED,
+        output_data=output_data,
+        result_hash=result_hash,
+    )
+
+
+@pytest.mark.asyncio
+async def test_verify_result_with_matching_hash(verifier):
+    """Nested payloads hash the same as the canonical JSON encoding"""
+    output_data = {"result": [1, 2.5, {"b": 1, "a": "é"}], "meta": {"z": None, "y": True}}
+    result = make_result(output_data, verifier._calculate_result_hash(output_data))
+
+    assert await verifier.verify_result(result) is True
+
+
+@pytest.mark.asyncio
+async def test_verify_result_with_hash_mismatch(verifier):
+    """A wrong result hash fails verification"""
+    result = make_result({"result": 42}, "not-the-hash")
+
+    assert await verifier.verify_result(result) is False
+    assert verifier.get_verification_stats()["failed_verifications"] == 1
+
+
+@pytest.mark.asyncio
+async def test_verify_result_with_non_string_keys(verifier):
+    """Non-string keys fall back to the full JSON encoder"""
+    output_data = {1: "x", 2: "y"}
+    result = make_result(output_data, verifier._calculate_result_hash(output_data))
+
+    assert await verifier.verify_result(result) is True
+
+
+@pytest.mark.asyncio
+async def test_verify_result_with_mixed_keys_without_hash(verifier):
+    """Unsortable keys are fine when no hash has to be checked"""
+    result = make_result({1: "x", "result": 2})
+
+    assert await verifier.verify_result(result) is True
+
+
+@pytest.mark.asyncio
+async def test_format_and_range_rules(verifier):
+    """Format and range rules are applied to the walked output"""
+    verifier.add_verification_rule(
+        "task_001",
+        VerificationRule(
+            rule_type="format",
+            parameters={"required_fields": ["result"], "field_types": {"result": "int"}},
+            description="result is an int",
+        ),
+    )
+    verifier.add_verification_rule(
+        "task_001",
+        VerificationRule(
+            rule_type="range",
+            parameters={"field": "result", "min_value": 0, "max_value": 100},
+            description="result in range",
+        ),
+    )
+
+    assert await verifier.verify_result(make_result({"result": 42})) is True
+    assert await verifier.verify_result(make_result({"result": "42"})) is False
+    assert await verifier.verify_result(make_result({"result": 420})) is False
+    assert await verifier.verify_result(make_result({"error": "boom"})) is False
+
+
+@pytest.mark.asyncio
+async def test_hash_rule(verifier):
+    """Hash rules compare against the digest computed during the walk"""
+    output_data = {"result": "ok"}
+    verifier.add_verification_rule(
+        "task_001",
+        VerificationRule(
+            rule_type="hash",
+            parameters={"expected_hash": verifier._calculate_result_hash(output_data)},
+            description="pinned hash",
+        ),
+    )
+
+    assert await verifier.verify_result(make_result(output_data)) is True
+    assert await verifier.verify_result(make_result({"result": "other"})) is False
+
+
+@pytest.mark.asyncio
+async def test_verify_result_with_cbor_hash(verifier):
+    """Results declaring canonical CBOR are hashed with cbor2"""
+    cbor2 = pytest.importorskip("cbor2")
+
+    output_data = {"result": [1.5, 2, 3], "meta": {"b": 1, "a": 2}}
+    result = make_result(
+        output_data, hashlib.sha256(cbor2.dumps(output_data, canonical=True)).hexdigest()
+    )
+    result.hash_input = HashInput.CBOR_CANONICAL
+
+    assert await verifier.verify_result(result) is True
+
+
+def test_active_rule_count(verifier):
+    """active_rules tracks rule additions and removals"""
+    rule = VerificationRule(rule_type="custom", parameters={}, description="noop")
+    verifier.add_verification_rule("task_001", rule)
+    verifier.add_verification_rule("task_001", rule)
+    verifier.add_verification_rule("task_002", rule)
+    assert verifier.get_verification_stats()["active_rules"] == 3
+
+    verifier.remove_verification_rules("task_001")
+    verifier.remove_verification_rules("missing")
+    assert verifier.get_verification_stats()["active_rules"] == 1
+
+
+@pytest.mark.asyncio
+async def test_verify_result_on_thread_pool():
+    """Hashing is offloaded to the given thread pool"""
+    output_data = {"result": "ok"}
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        verifier = ResultVerifier(executor)
+        result = make_result(output_data, ResultVerifier()._calculate_result_hash(output_data))
+
+        assert await verifier.verify_result(result) is True
+
+
+def test_process_pool_is_rejected():
+    """The fused walk cannot be pickled, so process pools are refused up front"""
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(TypeError):
+            ResultVerifier(executor)
@@ -0,0 +1,207 @@
+"""
+Task Scheduler Tests
+
+Tests for task queueing, node selection and cancellation in the
+task scheduler.
+"""
+
+import asyncio
+
+import pytest
+
+from duxos_tasks.models import Task
+from duxos_tasks.task_scheduler import TaskScheduler
+
+
+class MockRegistryClient:
+    """Registry client returning a fixed node list"""
+
+    def __init__(self, nodes):
+        self.nodes = nodes
+        self.queries = 0
+
+    async def get_healthy_nodes(self):
+        """Get healthy nodes"""
+        self.queries += 1
+        return list(self.nodes)
+
+
+def make_node(node_id, **overrides):
+    """Build a registry node record"""
+    node = {
+        "node_id": node_id,
+        "cpu_cores": 4,
+        "memory_mb": 8192,
+        "storage_gb": 100,
+        "capabilities": ["api_call"],
+        "reputation": 80.0,
+        "success_rate": 0.9,
+    }
+    node.update(overrides)
+    return node
+
+
+@pytest.fixture
+def scheduler():
+    """Create a scheduler backed by the built-in mock nodes"""
+    return TaskScheduler()
+
+
+@pytest.mark.asyncio
+async def test_tasks_scheduled_by_priority(scheduler):
+    """Higher priority tasks are assigned first, FIFO within a priority"""
+    low = Task(service_name="text_processor", priority=1)
+    high = Task(service_name="text_processor", priority=5)
+    high_later = Task(service_name="text_processor", priority=5)
+    for task in (low, high, high_later):
+        assert await scheduler.submit_task(task) is True
+
+    assert scheduler.get_scheduling_stats()["queue_sizes"] == {1: 1, 2: 0, 3: 0, 4: 0, 5: 2}
+
+    assignments = await scheduler.schedule_tasks()
+
+    assert [a.task_id for a in assignments] == [high.task_id, high_later.task_id, low.task_id]
+    assert all(a.node_id == "node_001" for a in assignments)
+
+
+@pytest.mark.asyncio
+async def test_equal_tasks_do_not_compare(scheduler):
+    """Tasks with identical priority and timestamp are still orderable"""
+    first = Task(service_name="api_call", priority=3)
+    second = Task(service_name="api_call", priority=3, created_at=first.created_at)
+    await scheduler.submit_task(first)
+    await scheduler.submit_task(second)
+
+    assignments = await scheduler.schedule_tasks()
+
+    assert [a.task_id for a in assignments] == [first.task_id, second.task_id]
+
+
+@pytest.mark.asyncio
+async def test_cancel_pending_task(scheduler):
+    """Cancelled tasks are never assigned"""
+    keep = Task(service_name="data_analysis", priority=2)
+    drop = Task(service_name="data_analysis", priority=4)
+    await scheduler.submit_task(keep)
+    await scheduler.submit_task(drop)
+
+    assert await scheduler.cancel_task(drop.task_id) is True
+    assignments = await scheduler.schedule_tasks()
+
+    assert [a.task_id for a in assignments] == [keep.task_id]
+    assert scheduler.get_scheduling_stats()["load_distribution"] == {"node_002": 1}
+
+
+@pytest.mark.asyncio
+async def test_unschedulable_task_fails_after_retries(scheduler):
+    """Tasks no node can run count as failed assignments"""
+    await scheduler.submit_task(Task(service_name="unknown_service"))
+
+    assert await scheduler.schedule_tasks() == []
+    assert scheduler.get_scheduling_stats()["failed_assignments"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancel_then_resubmit(scheduler):
+    """Resubmitting a cancelled task queues it exactly once"""
+    task = Task(service_name="api_call")
+    await scheduler.submit_task(task)
+    await scheduler.cancel_task(task.task_id)
+    await scheduler.submit_task(task)
+
+    assignments = await scheduler.schedule_tasks()
+
+    assert [a.task_id for a in assignments] == [task.task_id]
+
+
+@pytest.mark.asyncio
+async def test_cancel_compacts_queue(scheduler):
+    """Cancelling many queued tasks shrinks the queue"""
+    tasks = [Task(service_name="api_call") for _ in range(200)]
+    for task in tasks:
+        await scheduler.submit_task(task)
+    for task in tasks[:100]:
+        await scheduler.cancel_task(task.task_id)
+
+    assert len(scheduler._heap) < 200
+    assert sum(scheduler.get_scheduling_stats()["queue_sizes"].values()) == 100
+
+
+@pytest.mark.asyncio
+async def test_equal_scores_break_ties_by_node_order():
+    """Identical nodes are chosen deterministically in registry order"""
+    scheduler = TaskScheduler(
+        registry_client=MockRegistryClient([make_node("node_a"), make_node("node_b")])
+    )
+    await scheduler.submit_task(Task(service_name="api_call"))
+
+    assignments = await scheduler.schedule_tasks()
+
+    assert [a.node_id for a in assignments] == ["node_a"]
+
+
+@pytest.mark.asyncio
+async def test_submit_many(scheduler):
+    """Bulk submission queues tasks in the same order as single submits"""
+    tasks = [Task(service_name="api_call", priority=p) for p in (1, 3, 5, 3)]
+
+    assert scheduler.submit_many(tasks) == 4
+    assert scheduler.get_scheduling_stats()["total_tasks"] == 4
+
+    assignments = await scheduler.schedule_tasks()
+
+    expected = [tasks[2], tasks[1], tasks[3], tasks[0]]
+    assert [a.task_id for a in assignments] == [t.task_id for t in expected]
+
+
+@pytest.mark.asyncio
+async def test_registry_nodes_cached_between_passes():
+    """Fresh registry results are reused; stale ones refresh in the background"""
+    registry = MockRegistryClient([make_node("node_a")])
+    scheduler = TaskScheduler(registry_client=registry)
+
+    scheduler.submit_task_nowait(Task(service_name="api_call"))
+    await scheduler.schedule_tasks()
+    scheduler.submit_task_nowait(Task(service_name="api_call"))
+    await scheduler.schedule_tasks()
+    assert registry.queries == 1
+
+    registry.nodes = [make_node("node_b")]
+    scheduler._nodes_cache_expiry = 0.0
+    scheduler.submit_task_nowait(Task(service_name="api_call"))
+    stale = await scheduler.schedule_tasks()
+    await scheduler._nodes_refresh
+
+    assert [a.node_id for a in stale] == ["node_a"]
+    assert registry.queries == 2
+    assert [n.node_id for n in scheduler._nodes_cache] == ["node_b"]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_applies_backpressure(scheduler):
+    """A full queue rejects non-blocking submits and blocks submit_task until drained"""
+    scheduler.max_queue_size = 2
+    assert scheduler.submit_many(Task(service_name="api_call") for _ in range(3)) == 2
+    assert scheduler.submit_task_nowait(Task(service_name="api_call")) is False
+
+    waiting = asyncio.ensure_future(scheduler.submit_task(Task(service_name="api_call")))
+    await asyncio.sleep(0)
+    assert not waiting.done()
+
+    await scheduler.schedule_tasks()
+
+    assert await asyncio.wait_for(waiting, timeout=1) is True
+    assert scheduler.get_scheduling_stats()["total_tasks"] == 3
+
+
+@pytest.mark.asyncio
+async def test_load_distribution_tracks_cancelled_assignments(scheduler):
+    """Cancelling an assigned task is reflected without another scheduling pass"""
+    task = Task(service_name="data_analysis")
+    await scheduler.submit_task(task)
+    await scheduler.schedule_tasks()
+    assert scheduler.get_scheduling_stats()["load_distribution"] == {"node_002": 1}
+
+    await scheduler.cancel_task(task.task_id)
+
+    assert scheduler.get_scheduling_stats()["load_distribution"] == {"node_002": 0}
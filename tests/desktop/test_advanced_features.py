@@ -0,0 +1,61 @@
+"""
+Advanced Features Tests
+
+Tests that the escrow and task widgets only open event sockets when their
+client opts in, and otherwise keep polling.
+"""
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+
+from frontend.duxnet_desktop.ui import advanced_features
+from frontend.duxnet_desktop.ui.advanced_features import (
+    EscrowClient,
+    EscrowManagementWidget,
+    TaskClient,
+    TaskEngineWidget,
+)
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def widgets(qapp, monkeypatch):
+    monkeypatch.setattr(advanced_features.BackgroundRpc, "call", lambda self, *args, **kwargs: None)
+    escrows = EscrowManagementWidget(EscrowClient("http://escrow"))
+    tasks = TaskEngineWidget(TaskClient("http://tasks"))
+    yield escrows, tasks
+    escrows.rpc.stop()
+    tasks.rpc.stop()
+
+
+def test_widgets_poll_without_event_sockets_by_default(widgets):
+    escrows, tasks = widgets
+
+    assert not hasattr(escrows, "escrow_events")
+    assert not hasattr(tasks, "task_events")
+    assert [entry["interval"] for entry in escrows.refresh_scheduler.entries] == [10.0]
+    assert [entry["interval"] for entry in tasks.refresh_scheduler.entries] == [5.0]
+
+
+def test_partial_records_display_without_raising(widgets):
+    escrows, tasks = widgets
+
+    escrows.escrows_model.update([{"id": "escrow-1"}, {"service_name": "no key"}])
+    tasks.tasks_model.upsert({"task_id": "task-1", "status": "RUNNING"})
+
+    for model in (escrows.escrows_model, tasks.tasks_model):
+        assert model.rowCount() == 1
+        texts = [model.data(model.index(0, column)) for column in range(model.columnCount())]
+        assert texts[0] in ("escrow-1", "task-1")
+    assert escrows.escrow_actions(escrows.escrows_model.record(0)) == [
+        ("Dispute", escrows.create_dispute)
+    ]
+    assert tasks.task_progress(tasks.tasks_model.record(0)) == 50
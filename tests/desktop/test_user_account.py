@@ -0,0 +1,113 @@
+"""
+User Account Widget Tests
+
+Tests that the account widget's background loads call the real wallet
+client with arguments it accepts.
+"""
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+
+from frontend.duxnet_desktop.ui.user_account import UserAccountWidget
+from frontend.duxnet_desktop.wallet_client import WalletClient
+
+
+class FakeResponse:
+    """Minimal requests.Response stand-in"""
+
+    def __init__(self, body):
+        self.status_code = 200
+        self.content = body
+        self.headers = {}
+
+
+class FakeSession:
+    """Serves canned JSON bodies by URL path"""
+
+    bodies = {
+        "/wallet/alice": b'{"address": "addr-alice", "balance": 1.5}',
+        "/balances": b'{"BTC": {"balance": 0.5, "address": "bc1"}}',
+    }
+
+    def get(self, url, **kwargs):
+        return FakeResponse(self.bodies[url.replace("http://wallet", "")])
+
+
+class FakeApiClient:
+    def get_user_favorites(self, user_id):
+        return [{"service_id": "svc1"}]
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    """Create the QApplication the widgets need"""
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def widget(qapp):
+    """Create an account widget over a real WalletClient"""
+    account_widget = UserAccountWidget(
+        FakeApiClient(), WalletClient("http://wallet", session=FakeSession())
+    )
+    yield account_widget
+    account_widget.rpc.stop()
+
+
+def test_load_user_data_fetches_reach_wallet_client(widget, monkeypatch):
+    """Each background fetch calls the client with a signature it accepts"""
+    fetched = {}
+    monkeypatch.setattr(
+        widget.rpc,
+        "call",
+        lambda key, fetch, on_result, on_error, supersede=False: fetched.setdefault(key, fetch()),
+    )
+    widget.current_user = {"user_id": "alice", "user_name": "Alice", "password": "pw"}
+
+    widget.load_user_data()
+
+    assert fetched["wallet"] == {"address": "addr-alice", "balance": 1.5}
+    assert fetched["balances"] == {"BTC": {"balance": 0.5, "address": "bc1"}}
+    assert fetched["favorites"] == [{"service_id": "svc1"}]
+
+
+def log_in(widget, user_id):
+    widget.user_id_input.setText(user_id)
+    widget.user_name_input.setText(user_id.title())
+    widget.password_input.setText("pw")
+    widget.login()
+
+
+def test_logout_clears_previous_users_profile(widget, monkeypatch, tmp_path):
+    """A user without a snapshot sees nothing of the previous user while loading"""
+    monkeypatch.setattr(widget, "snapshot_path", lambda user_id: str(tmp_path / f"{user_id}.json"))
+    monkeypatch.setattr(
+        widget.rpc,
+        "call",
+        lambda key, fetch, on_result, on_error, supersede=False: on_result(fetch()),
+    )
+    log_in(widget, "alice")
+    widget.flush_account_data()
+    assert widget.crypto_addresses["BTC"] == "bc1"
+
+    widget.logout()
+    # Bob's fetches are still in flight
+    monkeypatch.setattr(widget.rpc, "call", lambda *args, **kwargs: None)
+    log_in(widget, "bob")
+
+    labels = [widget.user_info, widget.wallet_address_label, widget.balance_label]
+    labels += [widget.favorites_label]
+    labels += widget.crypto_balance_labels.values()
+    labels += widget.crypto_address_labels.values()
+    texts = " ".join(label.text() for label in labels)
+    for alice_value in ("addr-alice", "1.50", "bc1", "0.50000000", "Favorites: 1"):
+        assert alice_value not in texts
+    assert widget.account_snapshot == {}
+
+    QtWidgets.QApplication.clipboard().setText("untouched")
+    widget.copy_crypto_address("BTC")
+    assert QtWidgets.QApplication.clipboard().text() == "untouched"
@@ -0,0 +1,59 @@
+"""
+Wallet Client Tests
+
+Tests that failed wallet lookups are reported to the caller without being
+memoized, so the next call goes back to the wallet API.
+"""
+
+import pytest
+
+from frontend.duxnet_desktop.wallet_client import WalletClient
+
+
+class FakeResponse:
+    """Minimal requests.Response stand-in"""
+
+    def __init__(self, body):
+        self.status_code = 200
+        self.content = body
+        self.headers = {}
+
+
+class FlakySession:
+    """Fails every request until healthy is set, then serves canned bodies"""
+
+    bodies = {
+        "/balances": b'{"BTC": {"balance": 0.5, "address": "bc1"}}',
+        "/transactions/FLOP?limit=10": b'[{"txid": "t1"}]',
+    }
+
+    def __init__(self):
+        self.healthy = False
+        self.requests = 0
+
+    def get(self, url, **kwargs):
+        self.requests += 1
+        if not self.healthy:
+            raise ConnectionError("wallet API down")
+        return FakeResponse(self.bodies[url.replace("http://wallet", "")])
+
+
+def test_transaction_history_errors_are_not_cached():
+    session = FlakySession()
+    client = WalletClient("http://wallet", session=session)
+
+    assert client.get_transaction_history() == []
+
+    session.healthy = True
+    assert client.get_transaction_history() == [{"txid": "t1"}]
+
+
+def test_all_balances_total_failure_raises_and_is_not_cached():
+    session = FlakySession()
+    client = WalletClient("http://wallet", session=session)
+
+    with pytest.raises(ConnectionError):
+        client.get_all_balances()
+
+    session.healthy = True
+    assert client.get_all_balances() == {"BTC": {"balance": 0.5, "address": "bc1"}}